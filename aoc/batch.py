@@ -0,0 +1,144 @@
+"""
+Solve a whole collection of inputs for a day, in one long-lived process.
+
+Inputs are streamed from a directory (searched recursively) or from a zip or
+tar archive, and solved one after the other by the day's solver, imported once.
+With --jobs, inputs are spread over a pool of worker processes, each importing
+the solver once, with a bounded number of inputs in flight. With --cache,
+inputs already solved by the same solver are answered from the on-disk cache
+of aoc.cache.
+
+Results are written as JSON lines, in the order inputs were read, e.g.:
+    python -m aoc.batch 4 inputs/passports/ --jobs 8 > answers.jsonl
+    python -m aoc.batch 1 reports.tar.gz --pattern "*.txt"
+"""
+import argparse
+import concurrent.futures
+import fnmatch
+import json
+import os
+import sys
+import tarfile
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aoc.cache import SolveCache, cached_solve
+from aoc.days import DAYS, Day
+from aoc.pool import bounded_map
+from aoc.runner import measure
+
+
+def iter_inputs(source: str, pattern: str = "*") -> Iterator[Tuple[str, bytes]]:
+    """Name and content of each input file in a directory or archive
+
+    Args:
+        source (str): directory, zip archive or (possibly compressed) tar archive
+        pattern (str, optional): glob pattern input file names must match.
+            Defaults to "*".
+
+    Yields:
+        Tuple[str, bytes]: path of the input relative to source, and its content
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for filename in sorted(fnmatch.filter(files, pattern)):
+                path = os.path.join(root, filename)
+                with open(path, "rb") as f:
+                    yield os.path.relpath(path, source), f.read()
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and fnmatch.fnmatch(os.path.basename(info.filename), pattern):
+                    yield info.filename, archive.read(info)
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive: # members are read as the archive is streamed
+                if member.isfile() and fnmatch.fnmatch(os.path.basename(member.name), pattern):
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        raise ValueError(f"Not a directory, zip or tar archive: {source}")
+
+
+def solve_input(day: Day, name: str, data: bytes, cache: Optional[SolveCache] = None) -> Dict[str, Any]:
+    """Answers to both parts of a day for one input, timed"""
+    if cache is None:
+        solver = day.load_solver()
+        answers, wall, _, _, status = measure(lambda: solver.solve(solver.parse(data)), trace_memory=False)
+    else:
+        result, wall, _, _, status = measure(cached_solve, day, data, cache, trace_memory=False)
+        answers = None
+        if result is not None:
+            answers, hit = result
+            status = "cached" if hit else status
+
+    part1, part2 = answers if answers is not None else (None, None)
+    return {"input": name, "day": day.number, "part1": part1, "part2": part2, "wall_s": wall, "status": status}
+
+
+# state of a pool worker, set once by _init_worker
+_worker_day: Optional[Day] = None
+_worker_cache: Optional[SolveCache] = None
+
+
+def _init_worker(day_number: int, cache_dir: Optional[str]):
+    global _worker_day, _worker_cache
+    _worker_day = DAYS[day_number]
+    _worker_day.load_solver() # import once per worker
+    _worker_cache = SolveCache(cache_dir) if cache_dir is not None else None
+
+
+def _solve_in_worker(named_input: Tuple[str, bytes]) -> Dict[str, Any]:
+    name, data = named_input
+    return solve_input(_worker_day, name, data, _worker_cache)
+
+
+def run_batch(day: Day, inputs: Iterable[Tuple[str, bytes]], jobs: Optional[int] = None,
+              cache: Optional[SolveCache] = None, in_flight: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Solve a stream of inputs for a day
+
+    Args:
+        day (Day): day to solve the inputs of
+        inputs (Iterable[Tuple[str, bytes]]): name and content of each input
+        jobs (Optional[int], optional): number of worker processes, 0 for the
+            number of CPUs. Defaults to None, solving in the current process.
+        cache (Optional[SolveCache], optional): cache to solve through. Defaults to None.
+        in_flight (Optional[int], optional): maximum number of inputs submitted
+            to the pool and not yet reported, bounding memory use.
+            Defaults to None, i.e. 4 per worker.
+
+    Yields:
+        Dict[str, Any]: result of each input, in input order
+    """
+    if jobs is None:
+        day.load_solver()
+        for name, data in inputs:
+            yield solve_input(day, name, data, cache)
+        return
+
+    jobs = jobs or os.cpu_count()
+    in_flight = in_flight or 4 * jobs
+    cache_dir = cache.directory if cache is not None else None
+    with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_worker,
+                                                initargs=(day.number, cache_dir)) as pool:
+        yield from bounded_map(pool, _solve_in_worker, inputs, in_flight)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("day", type=int, choices=sorted(DAYS), help="day to solve the inputs of")
+    parser.add_argument("source", help="directory, zip or tar archive of inputs")
+    parser.add_argument("--pattern", default="*", help="glob pattern of input file names (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, nargs="?", const=0, default=None,
+                        help="solve on JOBS worker processes (default when given: n. of CPUs)")
+    parser.add_argument("--cache", action="store_true", help="solve through the on-disk cache of aoc.cache")
+    args = parser.parse_args(argv)
+
+    cache = SolveCache() if args.cache else None
+    for result in run_batch(DAYS[args.day], iter_inputs(args.source, args.pattern), args.jobs, cache):
+        sys.stdout.write(json.dumps(result, default=str) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
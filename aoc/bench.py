@@ -0,0 +1,219 @@
+"""
+Benchmark suite with stored baselines and regression gates.
+
+Every day's parse and solve is run on its real input and on synthetic inputs
+of several sizes (see aoc.generators), recording the median wall time of a few
+repeats and the peak traced memory of an additional run. Each case runs in a
+fresh worker process, killed after a timeout.
+
+Results are compared to a JSON baseline: the suite fails (exit status 1) if a
+case got slower or hungrier than the baseline by more than a threshold, e.g.:
+    python -m aoc.bench --save                  # record baseline
+    python -m aoc.bench --threshold 0.25        # fail on >25% time regressions
+    python -m aoc.bench 11 18 --no-real --repeat 5
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from aoc.cache import read_day_input
+from aoc.days import DAYS
+from aoc.generators import generate
+from aoc.runner import measure
+
+DEFAULT_BASELINE = "bench_baseline.json"
+
+# synthetic inputs of each day: (size, generator options). Sizes are kept
+# small enough for the current solvers to complete in seconds
+SCALED_INPUTS: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {
+    1: [(1000, {}), (10000, {}), (100000, {})],
+    2: [(10000, {}), (100000, {})],
+    3: [(10000, {}), (100000, {})],
+    4: [(1000, {}), (10000, {})],
+    5: [(1000, {}), (10000, {})],
+    6: [(1000, {}), (10000, {})],
+    7: [(500, {}), (2000, {})],
+    8: [(200, {}), (800, {})],
+    9: [(1000, {}), (5000, {})],
+    10: [(100, {}), (1000, {})],
+    11: [(20, {}), (40, {})],
+    12: [(1000, {}), (10000, {})],
+    13: [(50, {}), (200, {})],
+    14: [(100, {}), (500, {})],
+    15: [(3, {}), (10, {})],
+    16: [(20, {"n_fields": 8}), (100, {"n_fields": 10})],
+    17: [(4, {}), (8, {})],
+    18: [(100, {}), (1000, {})],
+    19: [(50, {}), (500, {})],
+    21: [(100, {}), (1000, {})],
+    22: [(10, {}), (20, {})],
+    23: [(9, {})],
+    24: [(100, {}), (300, {})],
+    25: [(10000, {}), (100000, {})],
+}
+
+
+class Case(NamedTuple):
+    day: int
+    size: Optional[int] # None for the real input
+    options: Dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        if self.size is None:
+            return f"d{self.day}/real"
+        options = "".join(f"[{k}={v}]" for k, v in sorted(self.options.items()))
+        return f"d{self.day}/gen{self.size}{options}"
+
+
+def bench_cases(days: List[int], real: bool = True, scaled: bool = True) -> List[Case]:
+    cases = []
+    for day in days:
+        if real:
+            cases.append(Case(day, None, {}))
+        if scaled:
+            cases.extend(Case(day, size, options) for size, options in SCALED_INPUTS.get(day, []))
+    return cases
+
+
+def case_input(case: Case) -> bytes:
+    """Real input of the case's day, or its generated input"""
+    if case.size is None:
+        return read_day_input(DAYS[case.day])
+    return generate(case.day, case.size, seed=0, **case.options).encode()
+
+
+def run_case(case: Case, repeat: int, trace_memory: bool) -> Dict[str, Any]:
+    """Parse and solve a case's input repeat times (plus a traced run)
+
+    Returns:
+        Dict[str, Any]: median wall time (s), peak memory (KiB) when traced,
+            answers and status of the case
+    """
+    day = DAYS[case.day]
+    try:
+        data = case_input(case)
+        solver = day.load_solver()
+    except Exception as e: # e.g. missing input file or dependency of the solver
+        return {"status": f"error: {type(e).__name__}"}
+
+    def parse_and_solve():
+        return solver.solve(solver.parse(data))
+
+    times = []
+    for _ in range(repeat):
+        answers, wall, _, _, status = measure(parse_and_solve, trace_memory=False)
+        if status != "ok":
+            return {"status": status}
+        times.append(wall)
+
+    result = {"median_s": statistics.median(times), "answers": repr(answers), "status": "ok"}
+    if trace_memory:
+        result["peak_kib"] = measure(parse_and_solve, trace_memory=True)[3]
+    return result
+
+
+def run_isolated(func: Callable[..., Dict[str, Any]], args: Tuple, timeout: float) -> Dict[str, Any]:
+    """Call func(*args) in a fresh worker process, terminated after timeout seconds"""
+    pool = multiprocessing.Pool(1)
+    try:
+        return pool.apply_async(func, args).get(timeout)
+    except multiprocessing.TimeoutError:
+        return {"status": "timeout"}
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def compare(name: str, result: Dict[str, Any], baseline: Dict[str, Dict[str, Any]],
+            threshold: float, memory_threshold: float, min_delta_s: float = 0.002) -> List[str]:
+    """Regressions of a case's result with respect to its baseline
+
+    A case regresses if it stopped succeeding, or if its median time (resp.
+    peak memory) grew by more than threshold (resp. memory_threshold),
+    expressed as a fraction of the baseline. Time increases below min_delta_s
+    are ignored, as they are within timer noise for the fastest cases.
+
+    Returns:
+        List[str]: description of each regression, empty if none
+    """
+    base = baseline.get(name)
+    if base is None or base.get("status") != "ok":
+        return [] # nothing to compare with
+    if result["status"] != "ok":
+        return [f"{name}: {result['status']} (was ok)"]
+
+    regressions = []
+    if result["median_s"] > max(base["median_s"] * (1 + threshold), base["median_s"] + min_delta_s):
+        regressions.append(f"{name}: time {result['median_s']:.4f}s vs {base['median_s']:.4f}s baseline")
+    if "peak_kib" in result and "peak_kib" in base and result["peak_kib"] > base["peak_kib"] * (1 + memory_threshold):
+        regressions.append(f"{name}: memory {result['peak_kib']:.0f}KiB vs {base['peak_kib']:.0f}KiB baseline")
+    if base.get("answers") is not None and result["answers"] != base["answers"]:
+        regressions.append(f"{name}: answers {result['answers']} vs {base['answers']} baseline")
+    return regressions
+
+
+def format_result(name: str, result: Dict[str, Any], base: Optional[Dict[str, Any]], regressed: bool) -> str:
+    """One line summary of a case, with its baseline time if any"""
+    line = f"{name:<32} {result['status']:<24}"
+    if "median_s" in result:
+        line += f" {result['median_s']:>10.4f}s"
+    if base and "median_s" in base:
+        line += f" (baseline {base['median_s']:.4f}s)"
+    if "peak_kib" in result:
+        line += f" {result['peak_kib']:>10.0f}KiB"
+    return line + ("  REGRESSED" if regressed else "")
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="tolerated relative time increase (default: 0.2)")
+    parser.add_argument("--memory-threshold", type=float, default=0.1,
+                        help="tolerated relative peak memory increase (default: 0.1)")
+    parser.add_argument("--min-delta", type=float, default=0.002,
+                        help="time increase always tolerated, in seconds (default: 0.002)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, median is kept")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds before a case is abandoned")
+    parser.add_argument("--no-real", action="store_true", help="skip real inputs")
+    parser.add_argument("--no-scaled", action="store_true", help="skip synthetic inputs")
+    parser.add_argument("--no-memory", action="store_true", help="skip the memory traced run")
+    args = parser.parse_args(argv)
+
+    days = args.days or sorted(DAYS)
+    baseline = load_baseline(args.baseline)
+    results, regressions = {}, []
+    for case in bench_cases(days, real=not args.no_real, scaled=not args.no_scaled):
+        result = run_isolated(run_case, (case, args.repeat, not args.no_memory), args.timeout)
+        results[case.name] = result
+        case_regressions = compare(case.name, result, baseline, args.threshold, args.memory_threshold,
+                                   args.min_delta)
+        regressions.extend(case_regressions)
+        print(format_result(case.name, result, baseline.get(case.name), bool(case_regressions)), flush=True)
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions and not args.save else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Content-addressed on-disk cache of parsed inputs and answers.
+
+Entries are keyed by a hash of the day, the version of its solver (a hash of
+the source code of the modules solving it) and the input bytes, so editing a
+solver or its input invalidates its entries. Both the parsed input and the
+final answers are pickled. The least recently used entries are evicted when
+the cache grows beyond its size bound.
+
+The cache lives in $AOC_CACHE_DIR, by default ~/.cache/advent_of_code_2020:
+    python -m aoc.cache 15 19          # answers of days 15 and 19, cached
+    python -m aoc.cache 1 --input other_input.txt
+    python -m aoc.cache --clear
+"""
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+from types import ModuleType
+from typing import Any, List, Optional, Tuple
+
+from aoc.days import DAYS, Day
+from aoc.inputs import input_path
+
+DEFAULT_DIR = os.environ.get("AOC_CACHE_DIR",
+                             os.path.join(os.path.expanduser("~"), ".cache", "advent_of_code_2020"))
+DEFAULT_MAX_BYTES = 256 * 1024**2 # 256 MiB
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MISSING = object()
+
+
+def solver_version(day: Day) -> str:
+    """Hash of the source code of the modules solving a day
+
+    Includes the day's part modules, as well as the repository modules they
+    import (e.g. day 1 for day 9), or import functions and classes from
+    (e.g. aoc.inputs for as_text).
+
+    Args:
+        day (Day): day to get the solver version of
+
+    Returns:
+        str: hex digest identifying the current version of the day's solver
+    """
+    modules = {day.load(part) for part in day.parts()}
+    for module in list(modules):
+        for value in vars(module).values():
+            if inspect.isfunction(value) or inspect.isclass(value):
+                value = inspect.getmodule(value)
+            if isinstance(value, ModuleType) and getattr(value, "__file__", None) \
+                    and os.path.abspath(value.__file__).startswith(REPO_ROOT):
+                modules.add(value)
+
+    h = hashlib.sha256()
+    for module in sorted(modules, key=lambda m: m.__name__):
+        h.update(module.__name__.encode())
+        h.update(inspect.getsource(module).encode())
+    return h.hexdigest()
+
+
+class SolveCache():
+    """Size-bounded LRU cache of pickled parsed inputs and answers
+
+    Each entry is a file named after its key and kind ('parsed' or 'answers').
+    Reading an entry refreshes its modification time, which is used as
+    recency for the eviction.
+    """
+    def __init__(self, directory: str = DEFAULT_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.versions = {} # day number: solver version, computed once per process
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, day: Day, data: bytes) -> str:
+        """Content address of an input for a day's current solver"""
+        if day.number not in self.versions:
+            self.versions[day.number] = solver_version(day)
+
+        h = hashlib.sha256()
+        h.update(f"{day.number}:{self.versions[day.number]}:".encode())
+        h.update(data)
+        return h.hexdigest()
+
+    def _path(self, key: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{key}.{kind}.pickle")
+
+    def get(self, key: str, kind: str, default: Any = None) -> Any:
+        path = self._path(key, kind)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default # missing, or partially written by a concurrent process
+        os.utime(path) # mark as recently used
+        return value
+
+    def put(self, key: str, kind: str, value: Any):
+        path = self._path(key, kind)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path) # atomic, readers never see partial entries
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """(last use time, size, path) of each entry, least recently used first"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pickle"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue # evicted meanwhile
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+
+def cached_solve(day: Day, data: bytes, cache: SolveCache) -> Tuple[Tuple[Any, Any], bool]:
+    """Answers to both parts of a day for given input, through the cache
+
+    On a miss, the parsed input is looked up first, so that only solving is
+    repeated if answers were evicted. Parsed inputs are stored before solving,
+    as some solvers modify their input.
+
+    Args:
+        day (Day): day to solve
+        data (bytes): raw input
+        cache (SolveCache): cache to use
+
+    Returns:
+        Tuple[Tuple[Any, Any], bool]: answers to part 1 and 2, and whether
+            they were found in the cache
+    """
+    key = cache.key(day, data)
+    answers = cache.get(key, "answers", _MISSING)
+    if answers is not _MISSING:
+        return answers, True
+
+    solver = day.load_solver()
+    parsed = cache.get(key, "parsed", _MISSING)
+    if parsed is _MISSING:
+        parsed = solver.parse(data)
+        cache.put(key, "parsed", parsed)
+
+    answers = solver.solve(parsed)
+    cache.put(key, "answers", answers)
+    return answers, False
+
+
+def read_day_input(day: Day, path: Optional[str] = None) -> bytes:
+    """Raw bytes of given input file, by default the day's own input.txt"""
+    if path is None:
+        path = input_path(day.load_solver().__file__)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="*", type=int, help="days to solve (default: all)")
+    parser.add_argument("--input", help="input file to use instead of each day's input.txt")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="cache directory")
+    parser.add_argument("--max-mib", type=float, default=DEFAULT_MAX_BYTES / 1024**2,
+                        help="size bound of the cache, in MiB")
+    parser.add_argument("--clear", action="store_true", help="empty the cache and exit")
+    args = parser.parse_args(argv)
+
+    cache = SolveCache(args.dir, int(args.max_mib * 1024**2))
+    if args.clear:
+        cache.clear()
+        return
+
+    for number in (args.days or sorted(DAYS)):
+        day = DAYS[number]
+        answers, hit = cached_solve(day, read_day_input(day, args.input), cache)
+        print(f"day {number}: {answers[0]} {answers[1]}{' (cached)' if hit else ''}")
+
+
+if __name__ == "__main__":
+    main()
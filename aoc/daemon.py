@@ -0,0 +1,252 @@
+"""
+Warm solver daemon, answering requests on a local socket.
+
+The daemon keeps the day modules imported, and caches parsed inputs and
+answers (keyed by solving module and input hash), so that repeated requests
+skip interpreter startup, imports and parsing. Requests are accepted
+concurrently by an asyncio server, on a Unix socket or a localhost TCP port,
+and solved on a pool of worker threads.
+
+The protocol is one JSON object per line, each answered by one JSON line:
+    {"day": 1, "part": 2, "input": "1721\\n979\\n..."} -> {"answer": ..., "status": "ok", ...}
+    {"day": 1}                   both parts, on the day's own input.txt
+    {"op": "metrics"}            queue depth, latency percentiles, cache sizes
+
+e.g.:
+    python -m aoc.daemon serve &
+    python -m aoc.daemon solve 15 2
+    python -m aoc.daemon solve 1 --input other_input.txt
+    python -m aoc.daemon metrics
+"""
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import hashlib
+import json
+import os
+import socket
+import stat
+import statistics
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from aoc.cache import read_day_input
+from aoc.days import DAYS
+
+DEFAULT_SOCKET = os.path.join(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir()), f"aoc-{os.getuid()}.sock")
+
+
+class LRUDict(collections.OrderedDict):
+    """Dict keeping at most max_size entries, evicting the least recently used"""
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+
+
+class SolverDaemon():
+    """Solves requests with cached modules, parsed inputs and answers
+
+    Parts are given a deep copy of the cached parsed input, since some solvers
+    modify their input.
+    """
+    def __init__(self, workers: int = 1, max_parsed: int = 64, max_answers: int = 4096):
+        self.workers = workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(workers)
+        self.parsed = LRUDict(max_parsed)     # (module name, input hash): parsed input
+        self.answers = LRUDict(max_answers)   # (module name, input hash, part): answer
+        self.lock = threading.Lock()          # guards the caches across worker threads
+
+        self.waiting = 0  # requests queued for a worker
+        self.running = 0  # requests being solved
+        self.n_requests = 0
+        self.n_errors = 0
+        self.latencies = collections.deque(maxlen=1000) # of the most recent requests, in s
+        self._slots = None # semaphore of the worker threads, created in the event loop
+
+    def solve_part(self, day_number: int, part: int, data: bytes) -> Any:
+        """Answer to a part of a day for given input, through the caches"""
+        module = DAYS[day_number].load(part)
+        key = (module.__name__, hashlib.sha256(data).hexdigest())
+        with self.lock:
+            if key + (part,) in self.answers:
+                return self.answers[key + (part,)]
+            parsed = self.parsed.get(key)
+
+        if parsed is None:
+            parsed = module.parse(data)
+            with self.lock:
+                self.parsed[key] = parsed
+        answer = getattr(module, f"part{part}")(copy.deepcopy(parsed))
+        with self.lock:
+            self.answers[key + (part,)] = answer
+        return answer
+
+    def solve_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer(s) to a request, in a worker thread"""
+        day_number = int(request["day"])
+        if day_number not in DAYS:
+            raise ValueError(f"Unknown day: {day_number}")
+        day = DAYS[day_number]
+        data = request["input"].encode() if "input" in request else read_day_input(day)
+
+        if request.get("part") is not None:
+            part = int(request["part"])
+            if part not in day.parts():
+                raise ValueError(f"Unknown part {part} of day {day_number}, available: {list(day.parts())}")
+            return {"answer": self.solve_part(day_number, part, data)}
+        return {"answers": [self.solve_part(day_number, part, data) for part in day.parts()]}
+
+    async def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if request.get("op") == "metrics":
+            return self.metrics()
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        start = time.perf_counter()
+        self.n_requests += 1
+        self.waiting += 1
+        async with self._slots:
+            self.waiting -= 1
+            self.running += 1
+            try:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(self.executor, self.solve_request, request)
+                response["status"] = "ok"
+            except Exception as e:
+                self.n_errors += 1
+                response = {"status": f"error: {type(e).__name__}: {e}"}
+            finally:
+                self.running -= 1
+
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+        response.update({k: request[k] for k in ("id", "day", "part") if k in request})
+        response["latency_s"] = latency
+        return response
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer each line of a connection, in order"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"status": "error: invalid JSON request"}
+                else:
+                    response = await self.dispatch(request)
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass # client went away
+        finally:
+            writer.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        latency_metrics = {}
+        if latencies:
+            latency_metrics = {
+                "mean": statistics.mean(latencies),
+                "p50": latencies[len(latencies) // 2],
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max": latencies[-1],
+            }
+        return {
+            "status": "ok",
+            "queue_depth": self.waiting,
+            "running": self.running,
+            "requests": self.n_requests,
+            "errors": self.n_errors,
+            "latency_s": latency_metrics,
+            "cached_parsed": len(self.parsed),
+            "cached_answers": len(self.answers),
+        }
+
+
+async def serve(daemon: SolverDaemon, socket_path: str = DEFAULT_SOCKET, port: Optional[int] = None):
+    """Serve forever on a Unix socket, or on a localhost TCP port if given
+
+    An existing socket_path is only replaced if it is a socket no daemon
+    answers on, i.e. left by a previous daemon.
+    """
+    if port is None:
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise FileExistsError(f"Not a socket, refusing to replace it: {socket_path}")
+            try:
+                query({"op": "metrics"}, socket_path)
+            except ConnectionError:
+                os.remove(socket_path) # left by a previous daemon
+            else:
+                raise RuntimeError(f"A daemon is already serving on {socket_path}")
+        server = await asyncio.start_unix_server(daemon.handle, path=socket_path)
+    else:
+        server = await asyncio.start_server(daemon.handle, "127.0.0.1", port)
+    async with server:
+        await server.serve_forever()
+
+
+def query(request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET, port: Optional[int] = None) -> Dict[str, Any]:
+    """Send a request to a running daemon, and wait for its response"""
+    if port is None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    else:
+        sock = socket.create_connection(("127.0.0.1", port))
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(request).encode() + b"\n")
+        f.flush()
+        return json.loads(f.readline())
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--port", type=int, help="use this localhost TCP port instead of the Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument("--workers", type=int, default=1, help="solver threads (default: 1)")
+    solve_parser = commands.add_parser("solve", help="ask a running daemon for answers")
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("part", type=int, nargs="?", choices=[1, 2], help="part (default: both)")
+    solve_parser.add_argument("--input", help="input file (default: the day's input.txt, read by the daemon)")
+    commands.add_parser("metrics", help="print a running daemon's metrics")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        asyncio.run(serve(SolverDaemon(args.workers), args.socket, args.port))
+        return
+
+    request = {"op": "metrics"}
+    if args.command == "solve":
+        request = {"day": args.day, "part": args.part}
+        if args.input:
+            with open(args.input, "r") as f:
+                request["input"] = f.read()
+    print(json.dumps(query(request, args.socket, args.port), default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Registry of the solved days.
+
+Each day is described by the dotted module paths implementing its two parts.
+Modules are only referenced by name here, so that importing the registry does
+not import any solver (nor their dependencies, e.g. tqdm for days 23 and 24).
+
+Every part module exposes parse(text), parse_input_file() and a part1(parsed)
+or part2(parsed) function computing the answer to the corresponding part.
+The module solving the last part of a day also exposes solve(parsed), giving
+the answers to both parts from its own parsed input.
+
+Days also carry a rough estimate of each part's wall time on the real input,
+only used to schedule the slowest parts first when running in parallel.
+"""
+import importlib
+from types import ModuleType
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class Day(NamedTuple):
+    number: int
+    title: str
+    part_modules: Tuple[str, Optional[str]] # module solving part 1 and part 2 resp.
+    expected_s: Tuple[float, float] = (0.1, 0.1) # rough wall time of part 1 and part 2 resp.
+
+    def parts(self) -> Tuple[int, ...]:
+        """Parts solved for this day, i.e. those with a module"""
+        return tuple(part for part, module in enumerate(self.part_modules, 1) if module is not None)
+
+    def load(self, part: int) -> ModuleType:
+        """Import (once) and return the module solving given part"""
+        return importlib.import_module(self.part_modules[part-1])
+
+    def load_solver(self) -> ModuleType:
+        """Import (once) and return the module exposing parse and solve for the whole day"""
+        return self.load(self.parts()[-1])
+
+
+def _same_module(module: str) -> Tuple[str, str]:
+    return (module, module)
+
+
+DAYS: Dict[int, Day] = {day.number: day for day in [
+    Day(1, "report_repair", _same_module("d1_report_repair.problem1")),
+    Day(2, "password_philosophy", _same_module("d2_password_philosophy.problem2")),
+    Day(3, "toboggan_trajectory", _same_module("d3_toboggan_trajectory.problem3")),
+    Day(4, "passport_processing", _same_module("d4_passport_processing.problem4")),
+    Day(5, "binary_boarding", _same_module("d5_binary_boarding.problem5")),
+    Day(6, "custom_customs", _same_module("d6_custom_customs.problem6")),
+    Day(7, "handy_haversacks", _same_module("d7_handy_haversacks.problem7")),
+    Day(8, "handheld_halting", _same_module("d8_handheld_halting.problem8")),
+    Day(9, "encoding_error", _same_module("d9_encoding_error.problem9")),
+    Day(10, "adapter_array", _same_module("d10_adapter_array.problem10")),
+    Day(11, "seating_system", _same_module("d11_seating_system.problem11"), (5, 5)),
+    Day(12, "rain_risk", _same_module("d12_rain_risk.problem12")),
+    Day(13, "shuttle_search", _same_module("d13_shuttle_search.problem13")),
+    Day(14, "docking_data", _same_module("d14_docking_data.problem14"), (0.1, 4)),
+    Day(15, "rambunctious_recitation", _same_module("d15_rambunctious_recitation.problem15"),
+        (0.1, 17)),
+    Day(16, "ticket_translation", _same_module("d16_ticket_translation.problem16"), (0.1, 150)),
+    Day(17, "conway_cubes", ("d17_conway_cubes.problem17_part1",
+                             "d17_conway_cubes.problem17_part2"), (0.2, 8)),
+    Day(18, "operation_order", ("d18_operation_order.problem18_part1",
+                                "d18_operation_order.problem18_part2")),
+    Day(19, "monster_messages", ("d19_monster_messages.problem19_part1",
+                                 "d19_monster_messages.problem19_part2"), (35, 0.5)),
+    # day 20 was not solved
+    Day(21, "allergen_assessment", _same_module("d21_allergen_assessment.problem21")),
+    Day(22, "crab_combat", _same_module("d22_crab_combat.problem22"), (0.1, 15)),
+    Day(23, "crab_cups", ("d23_crab_cups.problem23",
+                          "d23_crab_cups.problem23_2"), (0.1, 60)),
+    Day(24, "lobby_layout", _same_module("d24_lobby_layout.problem24"), (0.1, 10)),
+    Day(25, "combo_breaker", ("d25_combo_breaker.problem25", None), (100, 0)), # day 25 has no part 2
+]}
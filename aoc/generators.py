@@ -0,0 +1,459 @@
+"""
+Synthetic, reproducible inputs of any size for every day.
+
+Each generator takes a random.Random and a size, and returns the text of an
+input following the format and the guarantees of the real puzzle input (e.g.
+a single corrupted instruction on day 8, a unique fields order on day 16), so
+that the solvers can be run on inputs much larger than the checked-in ones:
+    python -m aoc.generators 4 100000 --seed 1 > passports.txt
+
+The meaning of size depends on the day, see SIZE_MEANING.
+"""
+import argparse
+import random
+import string
+from typing import Callable, Dict, List, Optional
+
+SIZE_MEANING = {
+    1: "number of expense entries",
+    2: "number of password lines",
+    3: "number of landscape rows",
+    4: "number of passports",
+    5: "number of boarding passes",
+    6: "number of groups",
+    7: "number of bag rules",
+    8: "number of instructions",
+    9: "number of numbers",
+    10: "number of adapters",
+    11: "side of the square seat grid",
+    12: "number of navigation instructions",
+    13: "number of bus slots",
+    14: "number of memory writes",
+    15: "number of starting numbers",
+    16: "number of nearby tickets",
+    17: "side of the square initial slice",
+    18: "number of expressions",
+    19: "number of messages",
+    21: "number of foods",
+    22: "number of cards per player",
+    23: "ignored, inputs are always a permutation of 1..9",
+    24: "number of tiles to flip",
+    25: "maximum loop size of the public keys",
+}
+
+COLORS = ["red", "orange", "yellow", "green", "blue", "indigo", "violet", "black", "white",
+          "gray", "brown", "cyan", "magenta", "teal", "olive", "maroon", "lime", "plum"]
+ADJECTIVES = ["light", "dark", "bright", "muted", "faded", "dotted", "vibrant", "pale",
+              "dim", "posh", "wavy", "drab", "dull", "clear", "mirrored", "striped"]
+
+
+def gen_report_repair(rng: random.Random, size: int, total: int = 2020) -> str:
+    # plant one pair and one triple summing to total among random entries
+    a = rng.randrange(1, total)
+    b, c = rng.randrange(1, total//3), rng.randrange(1, total//3)
+    nums = [a, total - a, b, c, total - b - c]
+    nums += [rng.randrange(1, total) for _ in range(size - len(nums))]
+    rng.shuffle(nums)
+    return "\n".join(str(n) for n in nums) + "\n"
+
+
+def gen_password_philosophy(rng: random.Random, size: int) -> str:
+    lines = []
+    for _ in range(size):
+        length = rng.randrange(3, 21)
+        lo = rng.randrange(1, length)
+        hi = rng.randrange(lo+1, length+1)
+        char = rng.choice(string.ascii_lowercase[:8])
+        pwd = "".join(rng.choice(string.ascii_lowercase[:8]) for _ in range(length))
+        lines.append(f"{lo}-{hi} {char}: {pwd}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_toboggan_trajectory(rng: random.Random, size: int, width: int = 31, density: float = 0.25) -> str:
+    rows = ["".join('#' if rng.random() < density else '.' for _ in range(width)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+def gen_passport_processing(rng: random.Random, size: int) -> str:
+    def field_value(field: str, valid: bool) -> str:
+        if field == 'byr':
+            return str(rng.randrange(1920, 2003) if valid else rng.randrange(1900, 2040))
+        if field == 'iyr':
+            return str(rng.randrange(2010, 2021) if valid else rng.randrange(2000, 2040))
+        if field == 'eyr':
+            return str(rng.randrange(2020, 2031) if valid else rng.randrange(2000, 2040))
+        if field == 'hgt':
+            if valid:
+                return rng.choice([f"{rng.randrange(150, 194)}cm", f"{rng.randrange(59, 77)}in"])
+            return rng.choice([f"{rng.randrange(100, 250)}cm", f"{rng.randrange(40, 90)}in",
+                               str(rng.randrange(50, 200))])
+        if field == 'hcl':
+            if valid:
+                return '#' + "".join(rng.choice("0123456789abcdef") for _ in range(6))
+            return rng.choice(['#', '']) + "".join(rng.choice("0123456789abcdefz") for _ in range(rng.randrange(5, 8)))
+        if field == 'ecl':
+            if valid:
+                return rng.choice(["amb", "blu", "brn", "gry", "grn", "hzl", "oth"])
+            return rng.choice(["xry", "zzz", "blu2", "gmt", "lzr"])
+        if field == 'pid':
+            return "".join(rng.choice(string.digits) for _ in range(9 if valid else rng.choice([8, 10])))
+        return str(rng.randrange(50, 350)) # cid
+
+    fields = ['byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid', 'cid']
+    passports = []
+    for _ in range(size):
+        present = [f for f in fields if rng.random() < 0.93]
+        rng.shuffle(present)
+        valid = rng.random() < 0.6
+        tokens = [f"{f}:{field_value(f, valid or rng.random() < 0.8)}" for f in present]
+        # break records over lines at random, as in the real input
+        lines, line = [], []
+        for token in tokens:
+            line.append(token)
+            if rng.random() < 0.3:
+                lines.append(" ".join(line))
+                line = []
+        if line:
+            lines.append(" ".join(line))
+        passports.append("\n".join(lines))
+    return "\n\n".join(passports) + "\n"
+
+
+def gen_binary_boarding(rng: random.Random, size: int) -> str:
+    # contiguous ids with a single missing one in the middle, 3 column bits
+    # and as many row bits as needed (at least the 7 of the real plane)
+    n_bits = max(10, (size + 2).bit_length() + 1)
+    start = rng.randrange(0, (1 << n_bits) - size - 1)
+    ids = list(range(start, start + size + 1))
+    del ids[rng.randrange(1, size)]
+    rng.shuffle(ids)
+
+    def encode(seat_id: int) -> str:
+        bits = format(seat_id, f'0{n_bits}b')
+        return bits[:-3].translate(str.maketrans('01', 'FB')) + bits[-3:].translate(str.maketrans('01', 'LR'))
+    return "\n".join(encode(i) for i in ids) + "\n"
+
+
+def gen_custom_customs(rng: random.Random, size: int) -> str:
+    groups = []
+    for _ in range(size):
+        common = rng.sample(string.ascii_lowercase, rng.randrange(0, 6))
+        people = []
+        for _ in range(rng.randrange(1, 6)):
+            answers = set(common) | set(rng.sample(string.ascii_lowercase, rng.randrange(0, 8)))
+            answers = answers or {rng.choice(string.ascii_lowercase)}
+            people.append("".join(rng.sample(sorted(answers), len(answers))))
+        groups.append("\n".join(people))
+    return "\n\n".join(groups) + "\n"
+
+
+def gen_handy_haversacks(rng: random.Random, size: int) -> str:
+    # bags only contain bags of a higher index, roughly as a heap, so that rules
+    # form a DAG whose depth grows logarithmically with the number of rules
+    names = []
+    for i in range(size):
+        adjective = ADJECTIVES[i % len(ADJECTIVES)] + ("" if i < len(ADJECTIVES)*len(COLORS) else str(i))
+        names.append(f"{adjective} {COLORS[(i // len(ADJECTIVES)) % len(COLORS)]}")
+    # shiny gold at a quarter of the hierarchy, so it has containers and contents
+    names[size//4] = "shiny gold"
+
+    children_of = []
+    for i in range(size):
+        candidates = list(range(2*i + 1, min(size, 2*i + 5)))
+        children_of.append(set(rng.sample(candidates, rng.randrange(0, len(candidates) + 1))))
+    # make sure shiny gold contains bags, and can be contained through its chain of ancestors
+    if 2*(size//4) + 1 < size:
+        children_of[size//4].add(2*(size//4) + 1)
+    node = size//4
+    while node > 0:
+        parent = (node - 1) // 2
+        children_of[parent].add(node)
+        node = parent
+
+    lines = []
+    for name, children in zip(names, children_of):
+        if not children:
+            lines.append(f"{name} bags contain no other bags.")
+            continue
+        contents = []
+        for child in sorted(children):
+            n = rng.randrange(1, 6)
+            contents.append(f"{n} {names[child]} bag{'s' if n > 1 else ''}")
+        lines.append(f"{name} bags contain {', '.join(contents)}.")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def gen_handheld_halting(rng: random.Random, size: int) -> str:
+    # a program running straight to its end, except for one nop corrupted into a
+    # backward jmp. jmp +1 are equivalent to nops, and other nops only point backwards,
+    # so that fixing the corrupted instruction is the only way to terminate
+    size = max(size, 3)
+    corrupted = rng.randrange(1, size)
+    instrs = []
+    for i in range(size):
+        if i == corrupted:
+            instrs.append(f"jmp -{rng.randrange(1, i+1)}")
+            continue
+        kind = rng.choice(["acc", "acc", "nop", "jmp"])
+        if kind == "acc":
+            instrs.append(f"acc {rng.randrange(-50, 51):+d}")
+        elif kind == "jmp":
+            instrs.append("jmp +1")
+        else:
+            instrs.append(f"nop {-rng.randrange(1, i+1) if i > 0 else 0:+d}")
+    return "\n".join(instrs) + "\n"
+
+
+def gen_encoding_error(rng: random.Random, size: int, preamble: int = 25) -> str:
+    # every number is the sum of two of the preamble before it, except the last,
+    # which is the sum of a contiguous range of earlier numbers instead
+    size = max(size, preamble + 8)
+    nums = rng.sample(range(1, 4*preamble), preamble)
+    while len(nums) < size - 1:
+        a, b = rng.sample(nums[-preamble:], 2)
+        if a != b:
+            nums.append(a + b)
+
+    window = set(nums[-preamble:])
+    while True:
+        lo = rng.randrange(0, (size - 1) // 2)
+        invalid = sum(nums[lo: lo + rng.randrange(2, 6)])
+        if not any(invalid - n in window and invalid - n != n for n in window):
+            break
+    nums.append(invalid)
+    return "\n".join(str(n) for n in nums) + "\n"
+
+
+def gen_adapter_array(rng: random.Random, size: int) -> str:
+    adapters, joltage = [], 0
+    for _ in range(size):
+        joltage += rng.choice([1, 1, 1, 2, 3, 3])
+        adapters.append(joltage)
+    rng.shuffle(adapters)
+    return "\n".join(str(a) for a in adapters) + "\n"
+
+
+def gen_seating_system(rng: random.Random, size: int, floor: float = 0.15) -> str:
+    rows = ["".join('.' if rng.random() < floor else 'L' for _ in range(size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+def gen_rain_risk(rng: random.Random, size: int) -> str:
+    instrs = []
+    for _ in range(size):
+        action = rng.choice("NSEWLRFF")
+        value = rng.choice([90, 180, 270]) if action in "LR" else rng.randrange(1, 100)
+        instrs.append(f"{action}{value}")
+    return "\n".join(instrs) + "\n"
+
+
+def primes(n: int) -> List[int]:
+    """First n primes, greater than 10"""
+    found = []
+    candidate = 11
+    while len(found) < n:
+        if all(candidate % p for p in found if p*p <= candidate) and all(candidate % p for p in (2, 3, 5, 7)):
+            found.append(candidate)
+        candidate += 2
+    return found
+
+
+def gen_shuttle_search(rng: random.Random, size: int, bus_ratio: float = 0.2) -> str:
+    # bus ids must be pairwise coprime for the Chinese Remainder Theorem: use distinct primes
+    size = max(size, 2)
+    n_buses = max(2, int(size * bus_ratio))
+    positions = [0] + sorted(rng.sample(range(1, size), n_buses - 1))
+    bus_ids = rng.sample(primes(2*n_buses), n_buses)
+    slots = ['x'] * size
+    for pos, bus_id in zip(positions, bus_ids):
+        slots[pos] = str(bus_id)
+    return f"{rng.randrange(10**5, 10**7)}\n{','.join(slots)}\n"
+
+
+def gen_docking_data(rng: random.Random, size: int, max_floating: int = 9) -> str:
+    lines = []
+    for i in range(size):
+        if i % rng.randrange(3, 8) == 0:
+            mask = [rng.choice('01') for _ in range(36)]
+            for pos in rng.sample(range(36), rng.randrange(1, max_floating + 1)):
+                mask[pos] = 'X'
+            lines.append(f"mask = {''.join(mask)}")
+        lines.append(f"mem[{rng.randrange(0, 2**16)}] = {rng.randrange(0, 2**30)}")
+    if not lines[0].startswith("mask"):
+        lines.insert(0, "mask = " + "X" * 36)
+    return "\n".join(lines) + "\n"
+
+
+def gen_rambunctious_recitation(rng: random.Random, size: int) -> str:
+    return ",".join(str(n) for n in rng.sample(range(0, max(20, 3*size)), size)) + "\n"
+
+
+def gen_ticket_translation(rng: random.Random, size: int, n_fields: int = 20) -> str:
+    # field k accepts values up to a threshold growing with k (plus a shared high
+    # interval), and the column of field k always holds a value just below its
+    # threshold: only fields j >= k fit column k, so the order is unique
+    names = [f"departure {w}" for w in ["location", "station", "platform", "track", "date", "time"]]
+    names += [f"field{i}" for i in range(n_fields - len(names))]
+    names = names[:n_fields]
+    rng.shuffle(names)
+
+    step, base, high = 10, 100, 900
+    thresholds = [base + step*k for k in range(n_fields)]
+    rules = [f"{name}: 1-{thr} or {high}-{high + 50}" for name, thr in zip(names, thresholds)]
+
+    columns = list(range(n_fields)) # columns[position] = field index
+    rng.shuffle(columns)
+
+    def ticket(force_max: bool = False) -> List[int]:
+        values = [rng.randrange(1, thresholds[k] + 1) for k in columns]
+        if force_max:
+            values = [rng.randrange(thresholds[k] - step + 1, thresholds[k] + 1) for k in columns]
+        return values
+
+    nearby = [ticket(force_max=(i == 0)) for i in range(max(size, 1))]
+    for values in nearby:
+        if rng.random() < 0.2: # make some tickets invalid
+            values[rng.randrange(n_fields)] = rng.randrange(high + 51, high + 100)
+    rng.shuffle(nearby)
+
+    return "\n".join(rules) + "\n\nyour ticket:\n" + ",".join(str(v) for v in ticket()) +\
+        "\n\nnearby tickets:\n" + "\n".join(",".join(str(v) for v in t) for t in nearby) + "\n"
+
+
+def gen_conway_cubes(rng: random.Random, size: int, density: float = 0.4) -> str:
+    rows = ["".join('#' if rng.random() < density else '.' for _ in range(size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+def gen_operation_order(rng: random.Random, size: int, depth: int = 4, max_terms: int = 4) -> str:
+    def expr(d: int) -> str:
+        terms = []
+        for _ in range(rng.randrange(2, max_terms + 1)):
+            if d > 0 and rng.random() < 0.4:
+                terms.append(f"({expr(d - 1)})")
+            else:
+                terms.append(str(rng.randrange(1, 10)))
+        ops = [rng.choice("+*") for _ in range(len(terms) - 1)]
+        return " ".join(t for pair in zip(terms, ops + [""]) for t in pair if t)
+    return "\n".join(expr(depth) for _ in range(size)) + "\n"
+
+
+def gen_monster_messages(rng: random.Random, size: int, levels: int = 3) -> str:
+    # rules 42 and 31 expand, through `levels` levels of binary rules, to strings
+    # of length 2**levels. 0: 8 11, 8: 42, 11: 42 31 as in the real input
+    rules = {"0": "8 11", "8": "42", "11": "42 31"}
+    free_ids = (str(i) for i in range(1000) if str(i) not in ("0", "8", "11", "42", "31"))
+    a, b = next(free_ids), next(free_ids)
+    rules[a], rules[b] = '"a"', '"b"'
+
+    productions: Dict[str, List[List[str]]] = {a: [["a"]], b: [["b"]]}
+    layer = [a, b]
+    for level in range(levels):
+        next_layer = []
+        n_rules = 2 if level == levels - 1 else 4
+        for i in range(n_rules):
+            rule_id = ("42", "31")[i] if level == levels - 1 else next(free_ids)
+            alternatives = [[rng.choice(layer), rng.choice(layer)] for _ in range(rng.randrange(1, 3))]
+            rules[rule_id] = " | ".join(" ".join(alt) for alt in alternatives)
+            productions[rule_id] = alternatives
+            next_layer.append(rule_id)
+        layer = next_layer
+
+    def sample(rule_id: str) -> str:
+        return "".join(t if t in "ab" else sample(t) for t in rng.choice(productions[rule_id]))
+
+    messages = []
+    for _ in range(size):
+        if rng.random() < 0.5: # valid for part 2: m 42s followed by n < m 31s
+            n31 = rng.randrange(1, 3)
+            n42 = n31 + rng.randrange(1, 3)
+            messages.append("".join(sample("42") for _ in range(n42)) + "".join(sample("31") for _ in range(n31)))
+        else:
+            messages.append("".join(rng.choice("ab") for _ in range(rng.randrange(2, 6) * 2**levels)))
+
+    rule_lines = [f"{rule_id}: {rule}" for rule_id, rule in rules.items()]
+    rng.shuffle(rule_lines)
+    return "\n".join(rule_lines) + "\n\n" + "\n".join(messages) + "\n"
+
+
+def gen_allergen_assessment(rng: random.Random, size: int, n_allergens: int = 8, n_ingredients: int = 200) -> str:
+    ingredients = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randrange(4, 9)))
+                   for _ in range(n_ingredients)]
+    ingredients = list(dict.fromkeys(ingredients)) # unique
+    allergens = ["dairy", "eggs", "fish", "nuts", "peanuts", "sesame", "shellfish", "soy", "wheat"][:n_allergens]
+    allergen_ingrs = dict(zip(allergens, rng.sample(ingredients, len(allergens))))
+
+    foods = []
+    for _ in range(size):
+        listed = rng.sample(allergens, rng.randrange(1, 4))
+        ingrs = {allergen_ingrs[allergen] for allergen in listed}
+        ingrs |= set(rng.sample(ingredients, rng.randrange(5, 30)))
+        foods.append(f"{' '.join(rng.sample(sorted(ingrs), len(ingrs)))} (contains {', '.join(listed)})")
+    return "\n".join(foods) + "\n"
+
+
+def gen_crab_combat(rng: random.Random, size: int) -> str:
+    cards = list(range(1, 2*size + 1))
+    rng.shuffle(cards)
+    p1, p2 = cards[:size], cards[size:]
+    return "Player 1:\n" + "\n".join(map(str, p1)) + "\n\nPlayer 2:\n" + "\n".join(map(str, p2)) + "\n"
+
+
+def gen_crab_cups(rng: random.Random, size: int) -> str:
+    labels = list(range(1, 10))
+    rng.shuffle(labels)
+    return "".join(map(str, labels))
+
+
+def gen_lobby_layout(rng: random.Random, size: int, path_length: int = 20) -> str:
+    directions = ["e", "w", "ne", "nw", "se", "sw"]
+    return "\n".join("".join(rng.choice(directions) for _ in range(rng.randrange(1, path_length + 1)))
+                     for _ in range(size)) + "\n"
+
+
+def gen_combo_breaker(rng: random.Random, size: int, subj_num: int = 7, mod: int = 20201227) -> str:
+    card_loop, door_loop = rng.randrange(1, size + 1), rng.randrange(1, size + 1)
+    return f"{pow(subj_num, card_loop, mod)}\n{pow(subj_num, door_loop, mod)}\n"
+
+
+GENERATORS: Dict[int, Callable[..., str]] = {
+    1: gen_report_repair, 2: gen_password_philosophy, 3: gen_toboggan_trajectory,
+    4: gen_passport_processing, 5: gen_binary_boarding, 6: gen_custom_customs,
+    7: gen_handy_haversacks, 8: gen_handheld_halting, 9: gen_encoding_error,
+    10: gen_adapter_array, 11: gen_seating_system, 12: gen_rain_risk,
+    13: gen_shuttle_search, 14: gen_docking_data, 15: gen_rambunctious_recitation,
+    16: gen_ticket_translation, 17: gen_conway_cubes, 18: gen_operation_order,
+    19: gen_monster_messages, 21: gen_allergen_assessment, 22: gen_crab_combat,
+    23: gen_crab_cups, 24: gen_lobby_layout, 25: gen_combo_breaker,
+}
+
+
+def generate(day: int, size: int, seed: int = 0, **kwargs) -> str:
+    """Generate the text of a synthetic input for a day
+
+    Args:
+        day (int): day to generate an input for
+        size (int): size of the input, see SIZE_MEANING for each day
+        seed (int, optional): seed of the generator, the same seed and size
+            always give the same input. Defaults to 0.
+        kwargs: day specific options, see the generator of each day
+
+    Returns:
+        str: input text, parseable by the day's parse function
+    """
+    return GENERATORS[day](random.Random(seed), size, **kwargs)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(generate(args.day, args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
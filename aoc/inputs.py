@@ -0,0 +1,33 @@
+"""
+Helpers shared by the days' parse functions to accept any kind of input text.
+"""
+import os
+from typing import Union
+
+Text = Union[str, bytes]
+
+
+def as_text(text: Text) -> str:
+    """Decode bytes (e.g. read from a pipe or a buffer) as utf-8, leave str as is"""
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        return bytes(text).decode()
+    return text
+
+
+def input_path(module_file: str, filename: str = "input.txt") -> str:
+    """Path of an input file stored in the same directory as a day's module
+
+    Args:
+        module_file (str): __file__ of the day's module
+        filename (str, optional): name of the input file. Defaults to "input.txt".
+
+    Returns:
+        str: absolute path of the input file
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(module_file)), filename)
+
+
+def read_input(module_file: str, filename: str = "input.txt") -> str:
+    """Read an input file stored in the same directory as a day's module"""
+    with open(input_path(module_file, filename), "r") as file:
+        return file.read()
@@ -0,0 +1,104 @@
+"""
+Memory budgets of each day and part, checked with tracemalloc.
+
+Every day is run on the same real and synthetic inputs as the benchmark suite
+(see aoc.bench), measuring the peak traced memory of parsing and of each part
+separately: a part's peak only counts what it allocates beyond its parsed
+input. Peaks are checked against per-day budgets, which grow linearly with the
+size of the input, and the check fails (exit status 1) if any is exceeded, or
+if any case cannot be measured (error or timeout):
+    python -m aoc.memory                 # all days, all inputs
+    python -m aoc.memory 11 17 --no-real
+"""
+import argparse
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from aoc.bench import Case, bench_cases, case_input, run_isolated
+from aoc.days import DAYS
+from aoc.runner import measure
+
+
+class Budget(NamedTuple):
+    base_kib: float
+    per_input_kib: float = 0 # additional KiB allowed for each KiB of input
+
+    def limit_kib(self, input_bytes: int) -> float:
+        return self.base_kib + self.per_input_kib * input_bytes / 1024
+
+
+DEFAULT_BUDGET = Budget(1024, 32)
+
+# budgets of the stages ('parse', 'part1', 'part2') of each day, DEFAULT_BUDGET otherwise.
+# Set about 1.5 times the peaks measured on the real and synthetic inputs
+BUDGETS: Dict[int, Dict[str, Budget]] = {
+    14: {"part2": Budget(1024, 800)},      # every floating address is a dict entry
+    15: {"part2": Budget(600 * 1024)},     # dict of the last turn of 30M numbers
+    17: {"part2": Budget(3 * 1024)},       # dense 4-D nested lists
+    19: {"part1": Budget(320 * 1024)},     # set of all valid messages
+    22: {"part2": Budget(8 * 1024)},       # seen decks of every sub game
+    23: {"part2": Budget(256 * 1024)},     # 1M LLNode objects, and a dict of them
+    24: {"part2": Budget(3 * 1024)},
+}
+
+
+def budget(day: int, stage: str) -> Budget:
+    return BUDGETS.get(day, {}).get(stage, DEFAULT_BUDGET)
+
+
+def measure_case_memory(case: Case) -> Dict[str, Any]:
+    """Peak traced memory (KiB) of parsing and of each part of a case
+
+    Returns:
+        Dict[str, Any]: status, input size (bytes), and peak KiB of each stage
+    """
+    day = DAYS[case.day]
+    try:
+        data = case_input(case)
+        modules = {part: day.load(part) for part in day.parts()}
+    except Exception as e: # e.g. missing input file or dependency of the solver
+        return {"status": f"error: {type(e).__name__}"}
+
+    # each part gets its own parsed input, as some parts modify theirs
+    peaks = {"parse": 0}
+    for part, module in modules.items():
+        parsed, _, _, peak, status = measure(module.parse, data)
+        if status == "ok":
+            peaks["parse"] = max(peak, peaks["parse"])
+            _, _, _, peak, status = measure(getattr(module, f"part{part}"), parsed)
+        if status != "ok":
+            return {"status": status}
+        peaks[f"part{part}"] = peak
+    return {"status": "ok", "input_bytes": len(data), "peaks_kib": peaks}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="*", type=int, help="days to check (default: all)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds before a case is abandoned")
+    parser.add_argument("--no-real", action="store_true", help="skip real inputs")
+    parser.add_argument("--no-scaled", action="store_true", help="skip synthetic inputs")
+    args = parser.parse_args(argv)
+
+    print("case,stage,peak_kib,budget_kib,status")
+    failures = [] # over budget, or not measured
+    for case in bench_cases(args.days or sorted(DAYS), real=not args.no_real, scaled=not args.no_scaled):
+        result = run_isolated(measure_case_memory, (case,), args.timeout)
+        if result["status"] != "ok":
+            failures.append(f"{case.name}: not measured, {result['status']}")
+            print(f"{case.name},,,,{result['status']}", flush=True)
+            continue
+        for stage, peak in result["peaks_kib"].items():
+            limit = budget(case.day, stage).limit_kib(result["input_bytes"])
+            status = "ok" if peak <= limit else "over budget"
+            if peak > limit:
+                failures.append(f"{case.name} {stage}: {peak:.0f}KiB > {limit:.0f}KiB budget")
+            print(f"{case.name},{stage},{peak:.0f},{limit:.0f},{status}", flush=True)
+
+    for message in failures:
+        print(message, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
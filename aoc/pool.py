@@ -0,0 +1,35 @@
+"""
+Helpers shared by the modules fanning work out to process pools.
+"""
+import collections
+import concurrent.futures
+from typing import Any, Callable, Iterable, Iterator
+
+
+def bounded_map(pool: concurrent.futures.Executor, func: Callable[[Any], Any], items: Iterable[Any],
+                in_flight: int) -> Iterator[Any]:
+    """Results of func on each item, computed on pool, in the order of items
+
+    Unlike Executor.map, items are only taken from the iterable as results are
+    yielded, with at most in_flight items submitted and not yet yielded, so
+    that streams of any size are processed in bounded memory. Results already
+    done are yielded without waiting for the bound to be reached.
+
+    Args:
+        pool (concurrent.futures.Executor): pool to submit func(item) to
+        func (Callable[[Any], Any]): function of a single item, picklable for
+            process pools
+        items (Iterable[Any]): items, possibly lazily generated
+        in_flight (int): maximum number of items submitted and not yet yielded
+
+    Yields:
+        Any: func(item) for each item. Exceptions raised by func are raised
+            when its result is reached.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append(pool.submit(func, item))
+        while len(pending) >= in_flight or (pending and pending[0].done()):
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,206 @@
+"""
+Opt-in profiling of the days' hot functions.
+
+Nothing here is active unless requested: hot functions are only wrapped, and
+stacks only sampled, inside the context managers below, so that regular runs
+pay no instrumentation cost.
+
+For each profiled day:
+    - registered hot functions (see HOT_FUNCTIONS) are temporarily replaced by
+      wrappers counting their calls and cumulative time,
+    - call stacks are sampled at a fixed CPU time interval and written as
+      flamegraph-compatible collapsed stacks (one 'f1;f2;f3 count' per line),
+    - optionally, the whole run is profiled with cProfile, dumping its stats.
+
+e.g.:
+    python -m aoc.profiling 8 11 --out profiles --cprofile
+    flamegraph.pl profiles/d11.collapsed > d11.svg
+"""
+import argparse
+import contextlib
+import cProfile
+import functools
+import importlib
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from aoc.cache import read_day_input
+from aoc.days import DAYS, Day
+from aoc.generators import generate
+
+# hot functions of each day, as 'module:attribute[.attribute]'
+HOT_FUNCTIONS: Dict[int, List[str]] = {
+    8: ["d8_handheld_halting.problem8:exec_instr"],
+    11: ["d11_seating_system.problem11:get_n_adj_occ"],
+    14: ["d14_docking_data.problem14:MaskingDictV2.get_addresses_recurse"],
+    17: ["d17_conway_cubes.problem17_part2:get_hypercube_val"],
+    24: ["d24_lobby_layout.problem24:count_black_neighbors"],
+}
+
+
+def register_hot_function(day: int, target: str):
+    """Register a 'module:attribute[.attribute]' function as hot for a day"""
+    HOT_FUNCTIONS.setdefault(day, []).append(target)
+
+
+class HotStats():
+    """Call count and cumulative time of a function
+
+    As for cProfile's cumulative time, time spent in recursive calls is only
+    counted once, by the outermost call.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.cumulative_s = 0.
+        self.depth = 0 # current recursion depth
+
+    def wrap(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.calls += 1
+            self.depth += 1
+            start = time.perf_counter() if self.depth == 1 else None
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                if start is not None:
+                    self.cumulative_s += time.perf_counter() - start
+        return wrapper
+
+
+_WRAPPER_CODE = HotStats().wrap(lambda: None).__code__ # hidden from sampled stacks
+
+
+def _resolve(target: str) -> Tuple[Any, str]:
+    """Object owning a target function (module or class), and its attribute name"""
+    module_name, path = target.split(":")
+    owner = importlib.import_module(module_name)
+    *owners, attribute = path.split(".")
+    for name in owners:
+        owner = getattr(owner, name)
+    return owner, attribute
+
+
+@contextlib.contextmanager
+def hot_counters(targets: List[str]) -> Iterator[Dict[str, HotStats]]:
+    """Count calls and time of target functions within the context
+
+    Functions are replaced on their module or class, so calls going through
+    the module's globals or the instance's attributes are all counted. The
+    original functions are restored on exit.
+
+    Args:
+        targets (List[str]): functions to count, as 'module:attribute[.attribute]'
+
+    Yields:
+        Dict[str, HotStats]: statistics of each target, updated as functions are called
+    """
+    stats = {target: HotStats() for target in targets}
+    patched = []
+    try:
+        for target in targets:
+            owner, attribute = _resolve(target)
+            original = vars(owner)[attribute]
+            setattr(owner, attribute, stats[target].wrap(original))
+            patched.append((owner, attribute, original))
+        yield stats
+    finally:
+        for owner, attribute, original in reversed(patched):
+            setattr(owner, attribute, original)
+
+
+class StackSampler():
+    """Sample the call stack every interval seconds of CPU time (SIGPROF)
+
+    Only frames below the one entering the sampler are recorded. Unix only,
+    and must be used from the main thread.
+    """
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks = Counter() # collapsed stack: n. of samples
+        self._root = None
+        self._previous_handler = None
+
+    def _sample(self, signum, frame):
+        names = []
+        while frame is not None and frame is not self._root:
+            code = frame.f_code
+            if code is not _WRAPPER_CODE:
+                name = getattr(code, "co_qualname", code.co_name) # co_qualname from python 3.11
+                names.append(f"{frame.f_globals.get('__name__', '?')}:{name}")
+            frame = frame.f_back
+        self.stacks[";".join(reversed(names))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._root = sys._getframe(1)
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+        self._root = None
+
+    def write_collapsed(self, out: TextIO):
+        for stack, count in sorted(self.stacks.items()):
+            out.write(f"{stack} {count}\n")
+
+
+def profile_day(day: Day, data: bytes, out_dir: str, interval: float = 0.001,
+                use_cprofile: bool = False) -> Dict[str, HotStats]:
+    """Parse and solve a day's input, profiling it
+
+    Writes <out_dir>/d<day>.collapsed, and <out_dir>/d<day>.prof if
+    use_cprofile is set (readable with pstats or snakeviz).
+
+    Returns:
+        Dict[str, HotStats]: statistics of the day's hot functions
+    """
+    solver = day.load_solver()
+    profiler = cProfile.Profile() if use_cprofile else None
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+            hot_counters(HOT_FUNCTIONS.get(day.number, [])) as hot, StackSampler(interval) as sampler:
+        if profiler:
+            profiler.enable()
+        try:
+            solver.solve(solver.parse(data))
+        finally:
+            if profiler:
+                profiler.disable()
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, f"d{day.number}.collapsed"), "w") as f:
+        sampler.write_collapsed(f)
+    if profiler:
+        profiler.dump_stats(os.path.join(out_dir, f"d{day.number}.prof"))
+    return hot
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="*", type=int, help="days to profile (default: those with hot functions)")
+    parser.add_argument("--out", default="profiles", help="output directory (default: profiles)")
+    parser.add_argument("--interval", type=float, default=0.001, help="stack sampling interval, in CPU seconds")
+    parser.add_argument("--cprofile", action="store_true", help="also profile the whole run with cProfile")
+    parser.add_argument("--size", type=int, help="profile a generated input of this size instead of the real one")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated input")
+    args = parser.parse_args(argv)
+
+    print("day,function,calls,cumulative_s")
+    for number in (args.days or sorted(HOT_FUNCTIONS)):
+        day = DAYS[number]
+        data = read_day_input(day) if args.size is None else generate(number, args.size, args.seed)
+        hot = profile_day(day, data, args.out, args.interval, args.cprofile)
+        for target, stats in hot.items():
+            print(f"{number},{target},{stats.calls},{stats.cumulative_s:.6f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Run, time and compare the solutions of any subset of days.
+
+Only the modules of the requested days are imported. For each day the input is
+parsed once per solving module, then each part is run, measuring wall time,
+CPU time and peak traced memory of every stage (parse, part1, part2).
+Results are written to stdout as a CSV (or JSON lines) table, e.g.:
+    python -m aoc.runner 1 5 15 --format json
+
+With --jobs N, every (day, part) is run as an independent job on a pool of N
+processes, scheduling the parts expected to be slowest first. Results are
+still reported in day and part order.
+
+With --cache, each day is solved as a whole through the on-disk cache of
+aoc.cache, reporting a single 'solve' stage with both answers.
+
+Solvers' own prints are silenced while they are being measured. Their traces
+(see aoc.trace) are written to stderr when enabled with --trace.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+import tracemalloc
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from aoc.cache import SolveCache, cached_solve, read_day_input
+from aoc.days import DAYS, Day
+from aoc import trace
+
+
+class Measurement(NamedTuple):
+    day: int
+    stage: str          # 'parse', 'part1', 'part2' or 'solve'
+    answer: Any
+    wall_s: float
+    cpu_s: float
+    peak_kib: Optional[float] # None if memory was not traced
+    status: str         # 'ok', 'cached' or 'error: <ExceptionName>'
+
+
+FIELDS = Measurement._fields
+
+
+def measure(func: Callable, *args, trace_memory: bool = True):
+    """Call func(*args) measuring wall time, CPU time and peak traced memory
+
+    Exceptions raised by func are caught, and reported in the returned status.
+
+    Args:
+        func (Callable): function to measure
+        trace_memory (bool, optional): whether to trace allocations with
+            tracemalloc. Tracing slows allocation-heavy code down noticeably.
+            Defaults to True.
+
+    Returns:
+        Tuple[Any, float, float, Optional[float], str]: result of the call
+            (None on error), wall time (s), CPU time (s), peak memory (KiB) and status.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    result, status = None, 'ok'
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = func(*args)
+    except Exception as e:
+        status = f'error: {type(e).__name__}'
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    peak_kib = None
+    if trace_memory:
+        peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+    return result, wall, cpu, peak_kib, status
+
+
+def load_part(day: Day, part: int) -> Tuple[Optional[ModuleType], str]:
+    """Import the module solving a part of a day, catching import errors as measure does
+
+    Returns:
+        Tuple[Optional[ModuleType], str]: module (None on error), and status
+    """
+    module, _, _, _, status = measure(day.load, part, trace_memory=False)
+    return module, status
+
+
+def run_part(day: Day, part: int, parsed: Any, trace_memory: bool = True) -> Measurement:
+    """Run a single part of a day on an already parsed input"""
+    module, status = load_part(day, part)
+    if module is None:
+        return Measurement(day.number, f'part{part}', None, 0., 0., None, status)
+    solve = getattr(module, f'part{part}')
+    answer, wall, cpu, peak, status = measure(solve, parsed, trace_memory=trace_memory)
+    return Measurement(day.number, f'part{part}', answer, wall, cpu, peak, status)
+
+
+def run_day(day: Day, parts: Iterable[int] = (1, 2), trace_memory: bool = True) -> List[Measurement]:
+    """Parse input and run requested parts of a day
+
+    Input is parsed once for each distinct module solving the parts.
+
+    Args:
+        day (Day): day to run
+        parts (Iterable[int], optional): parts to run, missing parts are skipped.
+            Defaults to (1, 2).
+        trace_memory (bool, optional): whether to measure peak memory. Defaults to True.
+
+    Returns:
+        List[Measurement]: one measurement per parse and part run
+    """
+    measurements = []
+    parsed_by_module: Dict[str, Any] = {}
+    for part in parts:
+        if part not in day.parts():
+            continue
+        module_name = day.part_modules[part-1]
+        if module_name not in parsed_by_module:
+            module, status = load_part(day, part)
+            parsed, wall, cpu, peak = None, 0., 0., None
+            if module is not None:
+                parsed, wall, cpu, peak, status = measure(module.parse_input_file, trace_memory=trace_memory)
+            measurements.append(Measurement(day.number, 'parse', None, wall, cpu, peak, status))
+            parsed_by_module[module_name] = parsed if status == 'ok' else None
+
+        if parsed_by_module[module_name] is None:
+            continue # parsing failed, nothing to solve
+        measurements.append(run_part(day, part, parsed_by_module[module_name], trace_memory))
+
+    return measurements
+
+
+def run_cached(day: Day, cache: SolveCache, trace_memory: bool = True) -> List[Measurement]:
+    """Solve a day's input through the cache, measuring the whole solve"""
+    solver, status = load_part(day, day.parts()[-1])
+    if solver is None:
+        return [Measurement(day.number, 'solve', None, 0., 0., None, status)]
+    data = read_day_input(day)
+    result, wall, cpu, peak, status = measure(cached_solve, day, data, cache, trace_memory=trace_memory)
+    answers = None
+    if result is not None:
+        answers, hit = result
+        status = 'cached' if hit else status
+    return [Measurement(day.number, 'solve', answers, wall, cpu, peak, status)]
+
+
+def run_job(day_number: int, part: int, trace_memory: bool = True) -> List[Measurement]:
+    """Parse input and run a single part of a day, in a pool worker"""
+    return run_day(DAYS[day_number], (part,), trace_memory)
+
+
+def run_parallel(days: Iterable[Day], parts: Iterable[int] = (1, 2), jobs: Optional[int] = None,
+                 trace_memory: bool = True) -> Iterator[Measurement]:
+    """Run days' parts as independent jobs on a process pool
+
+    Jobs are submitted longest expected first, so that the slowest parts do
+    not end up queued behind the fast ones, bounding the total wall time by the
+    slowest single part given enough workers. Since each job parses its own
+    input, parse measurements are reported for each part.
+
+    Args:
+        days (Iterable[Day]): days to run
+        parts (Iterable[int], optional): parts to run. Defaults to (1, 2).
+        jobs (Optional[int], optional): number of worker processes.
+            Defaults to None, i.e. the number of CPUs.
+        trace_memory (bool, optional): whether to measure peak memory. Defaults to True.
+
+    Yields:
+        Measurement: measurements, in day and part order. A job failing
+            outside its measured stages is reported as an error of its part.
+    """
+    day_parts: List[Tuple[Day, int]] = [(day, part) for day in days for part in parts if part in day.parts()]
+    schedule = sorted(day_parts, key=lambda dp: dp[0].expected_s[dp[1]-1], reverse=True)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {(day.number, part): pool.submit(run_job, day.number, part, trace_memory)
+                   for day, part in schedule}
+        for day, part in day_parts:
+            try:
+                measurements = futures[(day.number, part)].result()
+            except Exception as e: # e.g. a worker died, or its result could not be sent back
+                measurements = [Measurement(day.number, f'part{part}', None, 0., 0., None,
+                                            f'error: {type(e).__name__}')]
+            yield from measurements
+
+
+def write_measurements(measurements: Iterable[Measurement], fmt: str = 'csv', out=sys.stdout):
+    """Write measurements as CSV (with header) or JSON lines"""
+    if fmt == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(FIELDS)
+        for m in measurements:
+            writer.writerow(m)
+            out.flush()
+    elif fmt == 'json':
+        for m in measurements:
+            out.write(json.dumps(m._asdict(), default=str) + '\n')
+            out.flush()
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', type=int, help='days to run (default: all)')
+    parser.add_argument('--parts', nargs='+', type=int, default=[1, 2], choices=[1, 2])
+    parser.add_argument('--format', default='csv', choices=['csv', 'json'])
+    parser.add_argument('--no-memory', action='store_true',
+                        help='do not trace memory (faster, more accurate timings)')
+    parser.add_argument('--cache', action='store_true',
+                        help='solve whole days through the on-disk cache of parsed inputs and answers')
+    parser.add_argument('-j', '--jobs', type=int, nargs='?', const=0, default=None,
+                        help='run parts in parallel on JOBS processes (default when given: n. of CPUs)')
+    parser.add_argument('--trace', choices=list(trace.LEVELS), help='emit solvers\' traces from this level on')
+    parser.add_argument('--trace-sample', type=int, default=1,
+                        help='emit one trace every TRACE_SAMPLE with the same message')
+    args = parser.parse_args(argv)
+
+    unknown = [d for d in args.days if d not in DAYS]
+    if unknown:
+        parser.error(f'unknown days: {unknown}, available: {sorted(DAYS)}')
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    days = [DAYS[d] for d in (args.days or sorted(DAYS))]
+    if args.trace:
+        # environment is inherited by pool workers, whatever their start method
+        os.environ['AOC_TRACE'], os.environ['AOC_TRACE_SAMPLE'] = args.trace, str(args.trace_sample)
+        trace.configure(args.trace, args.trace_sample)
+
+    if args.cache:
+        cache = SolveCache()
+        measurements = (m for day in days for m in run_cached(day, cache, not args.no_memory))
+    elif args.jobs is None:
+        measurements = (m for day in days for m in run_day(day, args.parts, not args.no_memory))
+    else:
+        measurements = run_parallel(days, args.parts, args.jobs or None, not args.no_memory)
+    write_measurements(measurements, args.format)
+
+
+if __name__ == "__main__":
+    main()
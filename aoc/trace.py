@@ -0,0 +1,72 @@
+"""
+Levelled, sampled tracing of the solvers' intermediate state.
+
+Solvers call trace(level, message, *args) instead of printing. A trace is
+emitted only if its level is enabled, and only once every `sample` calls with
+the same message. Until then its message is not formatted and its callable
+arguments are not evaluated, so disabled traces cost a function call and a
+comparison. Traces are written to stderr, leaving stdout to the answers.
+
+Level and sampling are set with configure(), or from the environment, e.g.:
+    AOC_TRACE=debug AOC_TRACE_SAMPLE=100 python -m d6_custom_customs.problem6
+"""
+import os
+import sys
+from collections import Counter
+from typing import Any, Optional, Union
+
+TRACE = 5     # bulk internal state, e.g. whole sets of generated messages
+DEBUG = 10    # state at each iteration of a loop
+INFO = 20     # progress of long computations
+WARNING = 30  # unexpected values
+OFF = 100
+
+LEVELS = {"trace": TRACE, "debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+
+_level = WARNING
+_sample = 1
+_calls = Counter() # message: n. of enabled calls, for sampling
+
+
+def configure(level: Optional[Union[int, str]] = None, sample: Optional[int] = None):
+    """Set the minimum level of emitted traces, and emit one every sample calls
+
+    Args:
+        level (Optional[Union[int, str]], optional): level, or its name in LEVELS.
+            Defaults to None, leaving the level unchanged.
+        sample (Optional[int], optional): emit only one of every sample traces
+            with the same message. Defaults to None, leaving sampling unchanged.
+    """
+    global _level, _sample
+    if level is not None:
+        _level = LEVELS[level.lower()] if isinstance(level, str) else level
+    if sample is not None:
+        _sample = max(1, sample)
+    _calls.clear()
+
+
+def enabled(level: int) -> bool:
+    """Whether traces of given level are emitted, to guard costly preparation"""
+    return level >= _level
+
+
+def trace(level: int, message: str, *args: Any):
+    """Emit message formatted with args, if level is enabled and sampled
+
+    Args:
+        level (int): level of the trace, e.g. DEBUG
+        message (str): str.format template, also identifying the trace for sampling
+        args (Any): values to format. Callables are called (without arguments)
+            to get their value, only when the trace is emitted.
+    """
+    if level < _level:
+        return
+    if _sample > 1:
+        _calls[message] += 1
+        if (_calls[message] - 1) % _sample:
+            return
+    values = [arg() if callable(arg) else arg for arg in args]
+    print(message.format(*values), file=sys.stderr)
+
+
+configure(os.environ.get("AOC_TRACE"), int(os.environ.get("AOC_TRACE_SAMPLE", 1)))
@@ -1,13 +1,17 @@
 from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-def parse_input_file():
-    input_path = "./d10_adapter_array/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.readlines()
+from aoc.inputs import Text, as_text, read_input
+
+def parse(text: Text) -> List[int]:
+    lines = as_text(text).splitlines()
     return [int(line) for line in lines if line]
 
 
+def parse_input_file() -> List[int]:
+    return parse(read_input(__file__))
+
+
 
 def get_diff_distr(nums: List[int]) -> List[int]:
     """Get the distribution differences of pairs of subsequent nums in sorted input nums list
@@ -52,6 +56,23 @@ def get_adapter_combinations(nums: List[int]) -> int:
     return dp[n]
 
 
+def part1(adapter_array: List[int]) -> int:
+    """Number of 1-jolt differences times number of 3-jolt differences"""
+    distr = get_diff_distr(adapter_array)
+    # +1 required as builtin joltage adapter is 3 higher than highest adapter
+    return distr[1] * (distr[3]+1)
+
+
+def part2(adapter_array: List[int]) -> int:
+    """Number of distinct adapter arrangements"""
+    return get_adapter_combinations(adapter_array)
+
+
+def solve(adapter_array: List[int]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(adapter_array), part2(adapter_array)
+
+
 if __name__ == "__main__":
     adapter_array = parse_input_file()
     ans1 = get_diff_distr(adapter_array)
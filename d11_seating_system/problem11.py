@@ -1,16 +1,16 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import copy
 
+from aoc.inputs import Text, as_text, read_input
 
-def parse_input_file(test: bool = False):
-    if test:
-        input_path = "./d11_seating_system/test_input.txt"
-    else:
-        input_path = "./d11_seating_system/input.txt"
 
-    with open(input_path, "r") as file:
-        lines = file.readlines()
-    return [[char for char in s if char != '\n'] for s in lines]
+def parse(text: Text) -> List[List[str]]:
+    lines = as_text(text).splitlines()
+    return [[char for char in s] for s in lines]
+
+
+def parse_input_file(test: bool = False) -> List[List[str]]:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
 
 
 def get_n_adj_occ(seats_layout: List[str], y: int, x: int) -> int:
@@ -210,6 +210,21 @@ def final_n_occupied_seats(seats_layout: List[str], part: int = 1) -> int:
     return count
 
 
+def part1(layout: List[str]) -> int:
+    """Occupied seats once the adjacency rules stabilize"""
+    return final_n_occupied_seats(layout, part=1)
+
+
+def part2(layout: List[str]) -> int:
+    """Occupied seats once the visibility rules stabilize"""
+    return final_n_occupied_seats(layout, part=2)
+
+
+def solve(layout: List[str]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(layout), part2(layout)
+
+
 if __name__ == "__main__":
     layout = parse_input_file(test=False)
 
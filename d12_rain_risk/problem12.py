@@ -1,14 +1,17 @@
 from typing import List, Tuple
 
-def parse_input_file() -> List[Tuple[str, int]]:
-    input_path = "./d12_rain_risk/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.read().splitlines()
+from aoc.inputs import Text, as_text, read_input
 
+def parse(text: Text) -> List[Tuple[str, int]]:
+    lines = as_text(text).splitlines()
 
     return [(line[0], int(line[1:])) for line in lines]
 
 
+def parse_input_file() -> List[Tuple[str, int]]:
+    return parse(read_input(__file__))
+
+
 def exec_instr_part1(position: Tuple[int, int, int], instr: Tuple[str, int]) -> Tuple[int, int, int]:
     """
     Execute instruction from given position, return new position
@@ -184,6 +187,23 @@ def simulate_navigation(instructions: Tuple[str, int], part: int = 1) -> Tuple[i
 
 
 
+def part1(instructions: List[Tuple[str, int]]) -> int:
+    """Manhattan distance travelled moving the ship directly"""
+    position = simulate_navigation(instructions, part=1)
+    return abs(position[0]) + abs(position[1])
+
+
+def part2(instructions: List[Tuple[str, int]]) -> int:
+    """Manhattan distance travelled moving the ship towards the waypoint"""
+    position = simulate_navigation(instructions, part=2)
+    return abs(position[0]) + abs(position[1])
+
+
+def solve(instructions: List[Tuple[str, int]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(instructions), part2(instructions)
+
+
 if __name__ == "__main__":
     instructions = parse_input_file()
 
@@ -2,6 +2,9 @@ import functools
 import math
 from typing import List, Tuple
 
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, trace
+
 """
 Given an integer (earliest possible departure time) and a list of
 integers (ID corresponding to number of minutes between each departure
@@ -9,14 +12,16 @@ of each shuttle), return product of ID and number of minutes to wait for
 such shuttle
 """
 
-def parse_input_file(test: bool = False):
-    input_path = "./d13_shuttle_search/input.txt" if not test else "./d13_shuttle_search/test_input.txt"
-    with open(input_path, "r") as file:
-        lines = file.read().splitlines()
+def parse(text: Text) -> Tuple[int, List[str]]:
+    lines = as_text(text).splitlines()
 
     return int(lines[0]), lines[1].split(',')
 
 
+def parse_input_file(test: bool = False) -> Tuple[int, List[str]]:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
+
+
 def find_soonest_shuttle(departure: int, shuttle_ids: List[int]) -> int:
     """
     Solution to part 1
@@ -56,8 +61,7 @@ def subseq_ids_meet_condition(subseq_shuttle_ids: List[Tuple[int, int]], t):
         starting from minute 1.
     """
     for shuttle_id, offset in zip(*subseq_shuttle_ids):
-        print(shuttle_id, offset)
-        print(t+offset)
+        trace(DEBUG, "shuttle {} offset {}: t+offset={}", shuttle_id, offset, t+offset)
         # if shuttle_id does not divide timestamp + offset, fail condition and continue
         if not ((t + offset) % shuttle_id == 0):
             return False
@@ -133,15 +137,32 @@ def find_subsequent_departures_time_SQEUENTIAL(shuttle_ids: List[int]) -> int:
     return recurse(shuttle_ids_offsets[1:], 0, shuttle_ids_offsets[0][0])
 
 def recurse(ids_offsets, t, increment):
+    # originally tail recursive on ids_offsets[1:], one loop iteration per recursion
+    for shuttle_id, offset in ids_offsets:
+        while (t + increment + offset) % shuttle_id != 0:
+            t += increment
+
+        t, increment = t+increment, increment*shuttle_id
+
     # base case
-    if len(ids_offsets) == 0:
-        return t
+    return t
+
+
+def part1(notes: Tuple[int, List[str]]) -> int:
+    """Earliest shuttle id times minutes to wait for it"""
+    departure, shuttle_ids = notes
+    return find_soonest_shuttle(departure, shuttle_ids)
+
+
+def part2(notes: Tuple[int, List[str]]) -> int:
+    """Earliest timestamp with shuttles departing at their list offsets"""
+    _, shuttle_ids = notes
+    return find_subsequent_departures_time_CRT(shuttle_ids)
 
-    shuttle_id, offset = ids_offsets[0]
-    while (t + increment + offset) % shuttle_id != 0:
-        t += increment
 
-    return recurse(ids_offsets[1:], t+increment, increment*shuttle_id)
+def solve(notes: Tuple[int, List[str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(notes), part2(notes)
 
 
 if __name__ == "__main__":
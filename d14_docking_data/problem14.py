@@ -1,16 +1,10 @@
 from typing import List, Tuple, Union
 import re
 
-def parse_input_file(test: int = 0):
-    if test == 0 :
-        with open("./d14_docking_data/input.txt", 'r') as file:
-            lines = file.read().splitlines()
-    if test == 1 :
-        with open("./d14_docking_data/test_input.txt", 'r') as file:
-            lines = file.read().splitlines()
-    if test == 2 :
-        with open("./d14_docking_data/test_input2.txt", 'r') as file:
-            lines = file.read().splitlines()
+from aoc.inputs import Text, as_text, read_input
+
+def parse(text: Text) -> List[Union[Tuple[str, str], str]]:
+    lines = as_text(text).splitlines()
 
     instructions = [] # mix of mask and mem instructions
     for l in lines:
@@ -27,6 +21,11 @@ def parse_input_file(test: int = 0):
     return instructions
 
 
+def parse_input_file(test: int = 0) -> List[Union[Tuple[str, str], str]]:
+    filenames = {0: "input.txt", 1: "test_input.txt", 2: "test_input2.txt"}
+    return parse(read_input(__file__, filenames[test]))
+
+
 class MaskingDict(dict):
     """Extends dict with a binary masking function upon insertion
 
@@ -118,34 +117,23 @@ class MaskingDictV2(dict):
 
     def get_addresses_recurse(self, curr_addr: str, curr_mask: str, constructed_addr: str) -> List[str]:
         # given fill_leading zeros, both params have n_bits bits,
-        # so consider always [-1] bit of both and shorten both at each step
-        # therefore the base case is if they both reach length 0, so the constructed address
-        # is the address to be returned
-
-        # Base Case
-        if len(curr_addr) == 0:
-            assert len(curr_mask) == 0, 'curr_mask has no 0 length while curr_addr does'
-            return [constructed_addr]
-
-        if curr_mask[-1] == '0': # address bit unchanged
-            new_constr_addr = curr_addr[-1] + constructed_addr
-            new_addr = curr_addr[:-1]
-            new_mask = curr_mask[:-1]
-            return self.get_addresses_recurse(new_addr, new_mask, new_constr_addr)
-
-        elif curr_mask[-1] == '1':
-            new_constr_addr = '1' + constructed_addr
-            new_addr = curr_addr[:-1]
-            new_mask = curr_mask[:-1]
-            return self.get_addresses_recurse(new_addr, new_mask, new_constr_addr)
-
-        elif curr_mask[-1] == 'X':
-            new_constr_addr_0 = '0' + constructed_addr
-            new_constr_addr_1 = '1' + constructed_addr
-            new_addr = curr_addr[:-1]
-            new_mask = curr_mask[:-1]
-            return self.get_addresses_recurse(new_addr, new_mask, new_constr_addr_0) +\
-                self.get_addresses_recurse(new_addr, new_mask, new_constr_addr_1)
+        # so consider always [-1] bit of both and shorten both at each step,
+        # until they both reach length 0, so the constructed addresses
+        # are the addresses to be returned.
+        # Rather than recursing on each floating bit, all the addresses constructed
+        # so far are extended one bit at a time, in the order the recursion gave:
+        # addresses with 0 on a floating bit before those with 1, earlier bits first.
+        constructed_addrs = [constructed_addr]
+        for addr_bit, mask_bit in zip(reversed(curr_addr), reversed(curr_mask)):
+            if mask_bit == '0': # address bit unchanged
+                constructed_addrs = [addr_bit + addr for addr in constructed_addrs]
+            elif mask_bit == '1':
+                constructed_addrs = ['1' + addr for addr in constructed_addrs]
+            elif mask_bit == 'X':
+                constructed_addrs = [bit + addr for addr in constructed_addrs for bit in '01']
+
+        assert len(curr_mask) == len(curr_addr), 'curr_mask and curr_addr have different lengths'
+        return constructed_addrs
 
 
 
@@ -200,6 +188,21 @@ def exec_instructions_part2(instructions: List[Union[Tuple[int], str]]) -> int:
     return s
 
 
+def part1(instructions: List[Union[Tuple[int], str]]) -> int:
+    """Sum of memory values with the version 1 decoder chip"""
+    return exec_instructions_part1(instructions)
+
+
+def part2(instructions: List[Union[Tuple[int], str]]) -> int:
+    """Sum of memory values with the version 2 decoder chip"""
+    return exec_instructions_part2(instructions)
+
+
+def solve(instructions: List[Union[Tuple[int], str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(instructions), part2(instructions)
+
+
 if __name__ == "__main__":
     instructions = parse_input_file()
 
@@ -1,14 +1,14 @@
-from typing import List
+from typing import List, Tuple
 
-def parse_input_file(test: bool = False):
-    if test:
-        with open("d15_rambunctious_recitation/test_input.txt", 'r') as file:
-            nums = [int(n) for n in file.readline().split(",")]
-    else:
-        with open("d15_rambunctious_recitation/input.txt", 'r') as file:
-            nums = [int(n) for n in file.readline().split(",")]
+from aoc.inputs import Text, as_text, read_input
 
-    return nums
+def parse(text: Text) -> List[int]:
+    first_line = as_text(text).splitlines()[0]
+    return [int(n) for n in first_line.split(",")]
+
+
+def parse_input_file(test: bool = False) -> List[int]:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
 
 
 def find_nth_number_spoken(nums: List[int], n: int = 2020) -> int:
@@ -45,6 +45,21 @@ def find_nth_number_spoken(nums: List[int], n: int = 2020) -> int:
     return last_spoken
 
 
+def part1(nums: List[int]) -> int:
+    """2020th number spoken"""
+    return find_nth_number_spoken(nums, n=2020)
+
+
+def part2(nums: List[int]) -> int:
+    """30000000th number spoken"""
+    return find_nth_number_spoken(nums, n=30000000)
+
+
+def solve(nums: List[int]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(nums), part2(nums)
+
+
 if __name__ == "__main__":
     nums = parse_input_file(test=False)
 
@@ -1,14 +1,10 @@
 import re
 from typing import List, Dict, Tuple, Set
 
-def parse_input_file(test=False):
-    if test:
-        with open("./d16_ticket_translation/test_input.txt", 'r') as f:
-            txt = f.read()
+from aoc.inputs import Text, as_text, read_input
 
-    else:
-        with open("./d16_ticket_translation/input.txt", 'r') as f:
-            txt = f.read()
+def parse(text: Text) -> Tuple[Dict[str, Tuple[int]], List[int], List[List[int]]]:
+    txt = as_text(text)
 
     rules_txt, your_ticket_txt, nearby_tickets_txt = txt.split('\n\n')
 
@@ -29,6 +25,10 @@ def parse_input_file(test=False):
     return rules, your_ticket, nearby_tickets
 
 
+def parse_input_file(test=False) -> Tuple[Dict[str, Tuple[int]], List[int], List[List[int]]]:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
+
+
 def get_invalid_fields(rules: Dict[str, Tuple[int]], ticket: List[int]) -> List[int]:
     """Given set of rules and a single ticket, returns fields not conforming to any rule
 
@@ -96,7 +96,7 @@ def filter_out_invalid_tickets(rules: Dict[str, Tuple[int]], tickets: List[List[
             to the given input rules
     """
     valid_tickets = []
-    for ticket in nearby_tickets:
+    for ticket in tickets:
         invalid_fields = get_invalid_fields(rules, ticket)
         if len(invalid_fields) == 0: # if no invalid fields in the ticket
             valid_tickets.append(ticket)
@@ -128,7 +128,7 @@ def determine_field_positions(rules: Dict[str, Tuple[int]], tickets: List[List[i
                 lo1, hi1, lo2, hi2 = intervals
                 # check if rule name could not be at curr position
                 if not ((lo1<=field_val<=hi1) or (lo2<=field_val<=hi2)):
-                    possible_fields[idx].remove(field_name)
+                    possible_fields[idx].discard(field_name) # may have been ruled out by another ticket
 
 
     # now recurse to find the right combination
@@ -142,6 +142,10 @@ def recurse_positions_combinations(possible_fields: List[Set[str]], current_conf
         current_config (List[str]): constructed positions list until current recursive step.
         determined_fields (Set[str]): fields that have been given a position until current recursive step.
 
+    The backtracking search keeps an explicit stack of iterators over the
+    candidate fields of each position instead of recursing, trying
+    configurations in the same order as a recursive search would.
+
     Returns:
         List[str]: field name for each position in the list, corresponding to position in the ticket.
     """
@@ -150,18 +154,50 @@ def recurse_positions_combinations(possible_fields: List[Set[str]], current_conf
     if len(possible_fields) == 0:
         return current_config
 
-    # otherwise try every possible configuration at current step
-    for field_name in possible_fields[0]:
+    current_config = list(current_config) # extended with a field name per position in the stack
+    stack = [iter(possible_fields[0])]
+    while stack:
+        # otherwise try every possible configuration at current step
+        field_name = next(stack[-1], None)
+        if field_name is None: # all tried at current step, backtrack
+            stack.pop()
+            if stack:
+                determined_fields.remove(current_config.pop())
+            continue
         if field_name in determined_fields:
             continue # skip if we have already determined position for the given field name
         determined_fields.add(field_name)
-        ret = recurse_positions_combinations(possible_fields[1:], current_config+[field_name], determined_fields)
-        if ret is not None:
-            return ret
-        determined_fields.remove(field_name)
+        current_config.append(field_name)
+        if len(stack) == len(possible_fields):
+            return current_config # all fields have been determined
+        stack.append(iter(possible_fields[len(stack)]))
+
+
+
 
 
+def part1(notes: Tuple[Dict[str, Tuple[int]], List[int], List[List[int]]]) -> int:
+    """Ticket scanning error rate of nearby tickets"""
+    rules, _, nearby_tickets = notes
+    return sum_invalid_fields(rules, nearby_tickets)
+
+
+def part2(notes: Tuple[Dict[str, Tuple[int]], List[int], List[List[int]]]) -> int:
+    """Product of the departure fields of your ticket"""
+    rules, your_ticket, nearby_tickets = notes
+    valid_tickets = filter_out_invalid_tickets(rules, nearby_tickets)
+    field_positions = determine_field_positions(rules, valid_tickets)
+
+    ans = 1
+    for i, field_name in enumerate(field_positions):
+        if "departure" in field_name:
+            ans *= your_ticket[i]
+    return ans
+
 
+def solve(notes: Tuple[Dict[str, Tuple[int]], List[int], List[List[int]]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(notes), part2(notes)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,24 @@
 from typing import List, Tuple, Union
 import itertools
 
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, trace
+
 
 Plane = List[List[str]]
 Space = List[Plane] # Space[z][y][x] is the indexing order, where yx is the initial plane
 
 
-def parse_input_file(test: bool = False) -> Space:
-    if test:
-        with open('./d17_conway_cubes/test_input.txt', 'r') as f:
-            lines = f.read().splitlines()
-    else:
-        with open('./d17_conway_cubes/input.txt', 'r') as f:
-            lines = f.read().splitlines()
+def parse(text: Text) -> Space:
+    lines = as_text(text).splitlines()
 
     return [[[char for char in line] for line in lines]]
 
 
+def parse_input_file(test: bool = False) -> Space:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
+
+
 def get_empty_space(z_len, y_len, x_len) -> Space:
     # return [[['.']*x_len]*y_len]*z_len # Does NOT work because mutable objects shallow-copied
     return [[['.' for _ in range(x_len)] for _ in range(y_len)] for _ in range(z_len)]
@@ -141,6 +143,9 @@ def strip_empty_space(cube: Space) -> Space:
                     if x > max_x:
                         max_x = x
 
+    if max_z < min_z: # no active cube left, keep a single inactive one
+        return [[['.']]]
+
     # now trim space based on the max and min occurring active cubes
     # initialize empty cube
     new_z_len, new_y_len, new_x_len = max_z-min_z+1, max_y-min_y+1, max_x-min_x+1
@@ -154,19 +159,25 @@ def strip_empty_space(cube: Space) -> Space:
 
     return new_cube
 
-def print_space(space: Space):
-    """Print space to log,
+def format_space(space: Space) -> str:
+    """Render space as text, one z layer at a time,
         '#': active
         '.': inactive
     Args:
-        space (Space): space to print
+        space (Space): space to render
     """
     z_len, y_len, x_len = len(space), len(space[0]), len(space[0][0])
+    lines = []
     for z in range(z_len):
-        print(f"z={z-z_len//2}")
+        lines.append(f"z={z-z_len//2}")
         for y in range(y_len):
-            print("".join(space[z][y]))
-        print()
+            lines.append("".join(space[z][y]))
+        lines.append("")
+    return "\n".join(lines)
+
+def print_space(space: Space):
+    """Print space to log, see format_space"""
+    print(format_space(space))
 
 
 def perform_cycles(start_cube: Space, n: int) -> Space:
@@ -182,7 +193,7 @@ def perform_cycles(start_cube: Space, n: int) -> Space:
     curr_cube = start_cube
     for _ in range(n):
         curr_cube = expand_cube(curr_cube)
-        print_space(curr_cube)
+        trace(DEBUG, "{}", lambda: format_space(curr_cube))
     return curr_cube
 
 def count_active_subcubes(cube: Space) -> int:
@@ -212,6 +223,10 @@ def get_active_cubes_at(inp_cube: Space, t: int = 6) -> int:
     cube_at_t = perform_cycles(inp_cube, t)
     return count_active_subcubes(cube_at_t)
 
+def part1(inp_cube: Space) -> int:
+    """Active cubes after six cycles in 3 dimensions"""
+    return get_active_cubes_at(inp_cube, t=6)
+
 if __name__ == "__main__":
     inp_cube = parse_input_file(test=True)
     ans1 = get_active_cubes_at(inp_cube, t=6)
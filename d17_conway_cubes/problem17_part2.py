@@ -1,22 +1,25 @@
 from typing import List, Tuple, Union
 import itertools
 
+import d17_conway_cubes.problem17_part1 as problem17_part1
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, trace
+
 Line = List[str]
 Plane = List[Line]
 Space = List[Plane] # Space[z][y][x] is the indexing order, where yx is the initial plane
 Hyperspace = List[Space] # Hyperspace[w][z][y][x] is the indexing order, where yx is the initial plane
 
-def parse_input_file(test: bool = False) -> Space:
-    if test:
-        with open('./d17_conway_cubes/test_input.txt', 'r') as f:
-            lines = f.read().splitlines()
-    else:
-        with open('./d17_conway_cubes/input.txt', 'r') as f:
-            lines = f.read().splitlines()
+def parse(text: Text) -> Hyperspace:
+    lines = as_text(text).splitlines()
 
     return [[[[char for char in line] for line in lines]]] # return 2D slice of 4D hyperspace
 
 
+def parse_input_file(test: bool = False) -> Hyperspace:
+    return parse(read_input(__file__, "test_input.txt" if test else "input.txt"))
+
+
 def get_empty_hyperspace(w_len, z_len, y_len, x_len) -> Space:
     return [[[['.' for _ in range(x_len)] for _ in range(y_len)] for _ in range(z_len)] for _ in range(w_len)]
 
@@ -149,6 +152,9 @@ def strip_empty_hyperspace(hypercube: Hyperspace) -> Hyperspace:
                         if x > max_x:
                             max_x = x
 
+    if max_w < min_w: # no active cube left, keep a single inactive one
+        return get_empty_hyperspace(1, 1, 1, 1)
+
     # now trim space based on the max and min occurring active cubes
     # initialize empty cube
     new_w_len, new_z_len, new_y_len, new_x_len = max_w-min_w+1, max_z-min_z+1, max_y-min_y+1, max_x-min_x+1
@@ -163,20 +169,26 @@ def strip_empty_hyperspace(hypercube: Hyperspace) -> Hyperspace:
 
     return new_hypercube
 
-def print_hyperspace(hyperspace: Hyperspace):
-    """Print space to log,
+def format_hyperspace(hyperspace: Hyperspace) -> str:
+    """Render hyperspace as text, one (z, w) layer at a time,
         '#': active
         '.': inactive
     Args:
-        hyperspace (Hyperspace): Hyperspace to print
+        hyperspace (Hyperspace): Hyperspace to render
     """
     w_len, z_len, y_len, x_len = len(hyperspace), len(hyperspace[0]), len(hyperspace[0][0]), len(hyperspace[0][0][0])
+    lines = []
     for w in range(w_len):
         for z in range(z_len):
-            print(f"z={z-z_len//2}, w={w-w_len//2}")
+            lines.append(f"z={z-z_len//2}, w={w-w_len//2}")
             for y in range(y_len):
-                print("".join(hyperspace[w][z][y]))
-            print()
+                lines.append("".join(hyperspace[w][z][y]))
+            lines.append("")
+    return "\n".join(lines)
+
+def print_hyperspace(hyperspace: Hyperspace):
+    """Print hyperspace to log, see format_hyperspace"""
+    print(format_hyperspace(hyperspace))
 
 
 def perform_cycles(start_hypercube: Hyperspace, n: int) -> Hyperspace:
@@ -192,7 +204,7 @@ def perform_cycles(start_hypercube: Hyperspace, n: int) -> Hyperspace:
     curr_hypercube = start_hypercube
     for _ in range(n):
         curr_hypercube = expand_hypercube(curr_hypercube)
-        print_hyperspace(curr_hypercube)
+        trace(DEBUG, "{}", lambda: format_hyperspace(curr_hypercube))
     return curr_hypercube
 
 def count_active_subcubes(hypercube: Hyperspace) -> int:
@@ -223,6 +235,15 @@ def get_active_hypercubes_at(inp_hypercube: Hyperspace, t: int = 6) -> int:
     cube_at_t = perform_cycles(inp_hypercube, t)
     return count_active_subcubes(cube_at_t)
 
+def part2(inp_hypercube: Hyperspace) -> int:
+    """Active cubes after six cycles in 4 dimensions"""
+    return get_active_hypercubes_at(inp_hypercube, t=6)
+
+
+def solve(inp_hypercube: Hyperspace) -> Tuple[int, int]:
+    """Answers to both parts, part 1 running on the w=0 space of the hyperspace"""
+    return problem17_part1.part1(inp_hypercube[0]), part2(inp_hypercube)
+
 if __name__ == "__main__":
     inp_cube = parse_input_file()
     ans2 = get_active_hypercubes_at(inp_cube, t=6)
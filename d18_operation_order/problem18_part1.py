@@ -1,14 +1,12 @@
 from typing import List, Union
 import re
 
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, WARNING, trace
 
-def parse_input_file(test: int = 0):
-    if not test:
-        with open('./d18_operation_order/input.txt', 'r') as f:
-            lines = f.read().splitlines()
-    else:
-        with open(f'./d18_operation_order/test_input{test}.txt', 'r') as f:
-            lines = f.read().splitlines()
+
+def parse(text: Text) -> List[List[str]]:
+    lines = as_text(text).splitlines()
 
     parsed_input = []
     for line in lines:
@@ -18,6 +16,10 @@ def parse_input_file(test: int = 0):
     return parsed_input
 
 
+def parse_input_file(test: int = 0) -> List[List[str]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 
 def find_closing_bracket_idx(expr: List[str]) -> int:
     """Finds closing bracket of expression starting with bracket
@@ -62,7 +64,7 @@ def execute_op(op: str, num1: str, num2: str) -> str:
     elif op == '*':
         return str(int(num1) * int(num2))
     else:
-        print(f"!!! Op was: {op}")
+        trace(WARNING, "!!! Op was: {}", op)
 
 
 
@@ -93,10 +95,11 @@ def recurse_compute_expr(expr: List[str]) -> List[str]:
 
         # base case
         elif char == ')':
-            print(f"!!! Should not have found a closing bracket?!!!\n{expr}")
+            trace(WARNING, "!!! Should not have found a closing bracket?!!!\n{}", expr)
 
         elif char == '(':
-            closing_bracket_idx = find_closing_bracket_idx(expr)
+            # '(' was already consumed, put it back to find its matching ')' in expr
+            closing_bracket_idx = find_closing_bracket_idx(['('] + expr) - 1
             # op with recursive result
             if op is not None:
                 tot = execute_op(op, tot, recurse_compute_expr(expr[:closing_bracket_idx]))
@@ -124,12 +127,17 @@ def compute_sum_exprs(exprs: List[str]) -> int:
 
     tot = 0
     for i, expr in enumerate(exprs):
-        print(i+1)
+        trace(DEBUG, "expression {}", i+1)
         tot += int(recurse_compute_expr(expr))
     return tot
 
 
 
+def part1(exprs: List[List[str]]) -> int:
+    """Sum of the expressions evaluated left to right"""
+    return compute_sum_exprs(exprs)
+
+
 if __name__ == "__main__":
     exprs = parse_input_file(test=0)
     # print(exprs)
@@ -1,14 +1,13 @@
-from typing import List, Union
+from typing import List, Union, Tuple
 import re
 
+import d18_operation_order.problem18_part1 as problem18_part1
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, WARNING, trace
 
-def parse_input_file(test: int = 0):
-    if not test:
-        with open('./d18_operation_order/input.txt', 'r') as f:
-            lines = f.read().splitlines()
-    else:
-        with open(f'./d18_operation_order/test_input{test}.txt', 'r') as f:
-            lines = f.read().splitlines()
+
+def parse(text: Text) -> List[List[str]]:
+    lines = as_text(text).splitlines()
 
     parsed_input = []
     for line in lines:
@@ -18,6 +17,10 @@ def parse_input_file(test: int = 0):
     return parsed_input
 
 
+def parse_input_file(test: int = 0) -> List[List[str]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 
 def find_closing_bracket_idx(expr: List[str]) -> int:
     """Finds closing bracket of expression starting with bracket
@@ -86,7 +89,7 @@ def execute_op(op: str, num1: str, num2: str) -> str:
     elif op == '*':
         return str(int(num1) * int(num2))
     else:
-        print(f"!!! Op was: {op}")
+        trace(WARNING, "!!! Op was: {}", op)
 
 
 
@@ -206,11 +209,21 @@ def compute_sum_exprs(exprs: List[str]) -> int:
     tot = 0
     for i, expr in enumerate(exprs):
         tot += int(recurse_compute_expr(expr))
-        print(tot)
+        trace(DEBUG, "running total: {}", tot)
     return tot
 
 
 
+def part2(exprs: List[List[str]]) -> int:
+    """Sum of the expressions evaluated with sums before products"""
+    return compute_sum_exprs(exprs)
+
+
+def solve(exprs: List[List[str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return problem18_part1.part1(exprs), part2(exprs)
+
+
 if __name__ == "__main__":
     exprs = parse_input_file(test=0)
 
@@ -1,13 +1,10 @@
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from collections import defaultdict
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import TRACE, trace
 
-def parse_input_file(test: int = 0):
-    if not test:
-        with open('./d19_monster_messages/input.txt', 'r') as f:
-            rules, messages = f.read().split("\n\n")
-    else:
-        with open(f'./d19_monster_messages/test_input{test}.txt', 'r') as f:
-            rules, messages = f.read().split("\n\n")
+def parse(text: Text) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+    rules, messages = as_text(text).split("\n\n")
 
     parsed_rules = defaultdict(list)
     for rule in rules.splitlines():
@@ -20,31 +17,40 @@ def parse_input_file(test: int = 0):
     return parsed_rules, messages
 
 
+def parse_input_file(test: int = 0) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 def recurse_generate_messages(rules: Dict[int, List[List[str]]], valid_messages: Set[str],
                                 curr_mess: List[str], i: int, max_len: int):
-    print(valid_messages)
-    if len(curr_mess) > max_len:
-        return
-
-    if ''.join(curr_mess).isalpha():
-        valid_messages.add(''.join(curr_mess))
-        return
-
-    ## substitute first element with possible substitutes
-    el = curr_mess[i]
-    # skip end terminal tokens
-    #  and i < len(curr_mess)
-    while el.isalpha():
-        i += 1
+    # messages left to expand, with the position to expand them from, kept on an
+    # explicit stack rather than recursing, and popped in the recursion's order
+    stack = [(curr_mess, i)]
+    while stack:
+        curr_mess, i = stack.pop()
+        trace(TRACE, "valid messages: {}", valid_messages)
+        if len(curr_mess) > max_len:
+            continue
+
+        if ''.join(curr_mess).isalpha():
+            valid_messages.add(''.join(curr_mess))
+            continue
+
+        ## substitute first element with possible substitutes
         el = curr_mess[i]
-    # char is now first number element
+        # skip end terminal tokens
+        #  and i < len(curr_mess)
+        while el.isalpha():
+            i += 1
+            el = curr_mess[i]
+        # char is now first number element
 
 
-    # recurse with substituted mess
-    el_becomes = rules[el]
-    for new_els in el_becomes:
-        fork_mess = curr_mess[:i] + new_els + curr_mess[i+1:]
-        recurse_generate_messages(rules, valid_messages, fork_mess, i, max_len)
+        # expand later with substituted mess
+        el_becomes = rules[el]
+        for new_els in reversed(el_becomes):
+            fork_mess = curr_mess[:i] + new_els + curr_mess[i+1:]
+            stack.append((fork_mess, i))
 
 
 
@@ -77,6 +83,12 @@ def count_valid_messages(rules: Dict[int, List[List[str]]], messages: str, start
 
 
 
+def part1(notes: Tuple[Dict[str, List[List[str]]], List[str]]) -> int:
+    """Number of messages completely matching rule 0"""
+    rules, messages = notes
+    return count_valid_messages(rules, messages)
+
+
 if __name__ == "__main__":
     rules, messages = parse_input_file(test=2)
 
@@ -6,17 +6,15 @@ updated rules:
 
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from collections import defaultdict
+import d19_monster_messages.problem19_part1 as problem19_part1
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import TRACE, trace
 import re
 
-def parse_input_file(test: int = 0):
-    if not test:
-        with open('./d19_monster_messages/input.txt', 'r') as f:
-            rules, messages = f.read().split("\n\n")
-    else:
-        with open(f'./d19_monster_messages/test_input{test}.txt', 'r') as f:
-            rules, messages = f.read().split("\n\n")
+def parse(text: Text) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+    rules, messages = as_text(text).split("\n\n")
 
     parsed_rules = defaultdict(list)
     for rule in rules.splitlines():
@@ -29,6 +27,10 @@ def parse_input_file(test: int = 0):
     return parsed_rules, messages
 
 
+def parse_input_file(test: int = 0) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 
 def recurse_generate_patterns(rules: Dict[int, List[List[str]]], valid_patterns: Set[str],
                                 curr_pattern: List[str], i: int, max_len: int, curr_len: int= 1):
@@ -45,7 +47,8 @@ def recurse_generate_patterns(rules: Dict[int, List[List[str]]], valid_patterns:
             on the expected computational complexity, where n is at most 5.
 
     When a pattern contains no more numerical rules to expand, it is added to the
-    set of valid messages patterns valid_patterns.
+    set of valid messages patterns valid_patterns. Patterns forked by rule '11'
+    are kept on an explicit stack, instead of being expanded recursively.
 
     Args:
         rules (Dict[int, List[List[str]]]): message validity rules
@@ -58,46 +61,50 @@ def recurse_generate_patterns(rules: Dict[int, List[List[str]]], valid_patterns:
             curr_pattern. Starts from 1, with curr_pattern as 0.
 
     """
-    while i < len(curr_pattern):
-        # print(curr_pattern)
-        print(valid_patterns)
-        # change current element
-        el = curr_pattern[i]
-        # if current element is not numeric (anymore), increase i
-        # (i.e. skip '|', '(', ')' and terminal chars 'a', 'b')
-        if not el.isnumeric():
-            i += 1
-            continue
-
-        if el == '11':
-            # need to expand itself "a couple" of times? assumption is that messages
-            # have a limited size, so a too long regex won't match anyways
-            new_el = ['42', '31']
-            for _ in range(4):
-                new_pattern = curr_pattern[:i] + new_el + curr_pattern[i+1:]
-                recurse_generate_patterns(rules, valid_patterns, new_pattern, i, max_len, curr_len + len(new_el))
-
-                new_el = ['42'] + new_el + ['31']
-            return
-
+    stack = [(curr_pattern, i, curr_len)] # patterns left to expand
+    while stack:
+        curr_pattern, i, curr_len = stack.pop()
+        while i < len(curr_pattern):
+            # print(curr_pattern)
+            trace(TRACE, "valid patterns: {}", valid_patterns)
+            # change current element
+            el = curr_pattern[i]
+            # if current element is not numeric (anymore), increase i
+            # (i.e. skip '|', '(', ')' and terminal chars 'a', 'b')
+            if not el.isnumeric():
+                i += 1
+                continue
+
+            if el == '11':
+                # need to expand itself "a couple" of times? assumption is that messages
+                # have a limited size, so a too long regex won't match anyways
+                new_el = ['42', '31']
+                forks = []
+                for _ in range(4):
+                    new_pattern = curr_pattern[:i] + new_el + curr_pattern[i+1:]
+                    forks.append((new_pattern, i, curr_len + len(new_el)))
+
+                    new_el = ['42'] + new_el + ['31']
+                stack.extend(reversed(forks)) # expand the shortest fork first
+                break
 
-        transforms_to = rules[el]
-        curr_len_increment = min([len(k) for k in transforms_to])
-        curr_len += curr_len_increment
-        assert len(transforms_to) <= 2, (f'more than one pipe: {el}: {transforms_to}')
-        new_el = transforms_to[0] if len(transforms_to) == 1 else ['('] + transforms_to[0] + ['|'] + transforms_to[1] + [')']
 
-        # if '8': 42 | 42 8, so 42+
-        plus_quantifier = ['+'] if el == '8' else []
-        curr_pattern = curr_pattern[:i] + new_el + plus_quantifier + curr_pattern[i+1:] # exclude @i
+            transforms_to = rules[el]
+            curr_len_increment = min([len(k) for k in transforms_to])
+            curr_len += curr_len_increment
+            assert len(transforms_to) <= 2, (f'more than one pipe: {el}: {transforms_to}')
+            new_el = transforms_to[0] if len(transforms_to) == 1 else ['('] + transforms_to[0] + ['|'] + transforms_to[1] + [')']
 
+            # if '8': 42 | 42 8, so 42+
+            plus_quantifier = ['+'] if el == '8' else []
+            curr_pattern = curr_pattern[:i] + new_el + plus_quantifier + curr_pattern[i+1:] # exclude @i
 
-    # if no numbers in it, it's a valid pattern matching terminals
-    str_pattern = ''.join(curr_pattern)
-    if re.search('\d', str_pattern) is None:
-        # if no digit is matched, rule is terminal
-        valid_patterns.add(str_pattern)
-        return
+        else:
+            # if no numbers in it, it's a valid pattern matching terminals
+            str_pattern = ''.join(curr_pattern)
+            if re.search('\d', str_pattern) is None:
+                # if no digit is matched, rule is terminal
+                valid_patterns.add(str_pattern)
 
 
 
@@ -131,6 +138,17 @@ def count_valid_messages(rules: Dict[int, List[List[str]]], messages: str, start
 
 
 
+def part2(notes: Tuple[Dict[str, List[List[str]]], List[str]]) -> int:
+    """Number of messages matching rule 0 with the looping rules 8 and 11"""
+    rules, messages = notes
+    return count_valid_messages(rules, messages)
+
+
+def solve(notes: Tuple[Dict[str, List[List[str]]], List[str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return problem19_part1.part1(notes), part2(notes)
+
+
 if __name__ == "__main__":
     rules, messages = parse_input_file(test=0)
 
@@ -1,20 +1,39 @@
-from typing import List
+import bisect
+import math
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from aoc.inputs import Text, as_text, read_input
+
+try:
+    import numpy as np
+except ImportError: # optional, bitmaps are then plain bytearrays
+    np = None
 
 """
 Find two ints in input that sum up to 2020. Return their product.
 """
 
 
-def parse_input_file() -> List[int]:
+def parse(text: Text) -> List[int]:
     """Parse input ints
 
+    Args:
+        text (Text): one int per line
+
     Returns:
         List[int]: input ints
     """
-    input_path = "./d1_report_repair/input.txt"
-    with open(input_path, "r") as file:
-        input_list = [int(k) for k in file.read().strip().split("\n")]
-    return input_list
+    return [int(k) for k in as_text(text).strip().split("\n")]
+
+
+def parse_input_file() -> List[int]:
+    """Parse input ints from the input file
+
+    Returns:
+        List[int]: input ints
+    """
+    return parse(read_input(__file__))
 
 
 
@@ -41,10 +60,9 @@ def find_two_ints_summing_to(l: List[int], total: int) -> int:
 def find_three_ints_summing_to(l: List[int], total: int) -> int:
     """Find three ints in list that sum to total
 
-    Time complexity: O(n**2): iterate through all elements, compute
-        difference with each element
-    Space complexity: O(n**2): for each element, store
-        difference with each element
+    Time complexity: O(n**2): for each distinct int, two-pointer search
+        of the two others in the sorted distinct ints
+    Space complexity: O(n): distinct ints and their counts
 
     Args:
         l (list): positive integers
@@ -53,17 +71,300 @@ def find_three_ints_summing_to(l: List[int], total: int) -> int:
     Returns:
         int: product of the three integers that sum up to total
     """
-    seen = set()
-
-    for i in range(len(l)):
-        for j in range(i+1, len(l)):
-            num1 = l[i]
-            num2 = l[j]
-            target = total - num1 - num2
-            if target in seen:
-                return target * num1 * num2
-            seen.add(num2)
-            seen.add(num1)
+    ints = find_k_ints_summing_to(l, total, 3)
+    if ints is not None:
+        return math.prod(ints)
+
+
+def _bounded_counts(l: List[int], total: int, cap: int):
+    """Occurrences of each int in [0, total], capped at cap, indexed by int
+
+    Ints above total cannot be part of a sum of non negative ints to total,
+    and are ignored.
+
+    Returns:
+        numpy array if numpy is available, bytearray otherwise
+    """
+    if np is not None:
+        arr = np.asarray(l, dtype=np.int64)
+        if arr.size and arr.min() < 0:
+            raise ValueError("bitmap search requires non negative ints")
+        return np.minimum(np.bincount(arr[arr <= total], minlength=total+1), cap).astype(np.uint8)
+
+    counts = bytearray(total+1)
+    for n in l:
+        if n < 0:
+            raise ValueError("bitmap search requires non negative ints")
+        if n <= total and counts[n] < cap:
+            counts[n] += 1
+    return counts
+
+
+def find_two_ints_summing_to_bitmap(l: List[int], total: int) -> int:
+    """Find two ints in list that sum to total, for ints bounded by total
+
+    Alternative to find_two_ints_summing_to for large lists of non negative
+    ints: instead of hashing, ints are counted in an array indexed by int over
+    [0, total], so the complement of each int is found by direct indexing.
+
+    Time complexity: O(n + total)
+    Space complexity: O(total)
+
+    Args:
+        l (list): non negative integers
+        total (int): total to sum up two integers in l to
+
+    Returns:
+        int: product of the two integers that sum up to total
+    """
+    counts = _bounded_counts(l, total, 2)
+    if np is not None:
+        ints = np.arange(total+1)
+        found = (counts > 0) & (counts[::-1] > 0) & ((2*ints != total) | (counts > 1))
+        candidates = np.flatnonzero(found)
+        if candidates.size:
+            n = int(candidates[0])
+            return n * (total - n)
+        return None
+
+    for n in range(total//2 + 1):
+        if counts[n] and counts[total - n] and (2*n != total or counts[n] > 1):
+            return n * (total - n)
+
+
+def find_three_ints_summing_to_bitmap(l: List[int], total: int) -> int:
+    """Find three ints in list that sum to total, for ints bounded by total
+
+    Counts ints in an array indexed by int over [0, total] as in
+    find_two_ints_summing_to_bitmap. Then for each first int, the pairs
+    summing up to the rest of total are found over the whole row of second
+    ints at once with numpy, or a second int at a time without.
+
+    Time complexity: O(n + d * total), d distinct ints
+    Space complexity: O(total)
+
+    Args:
+        l (list): non negative integers
+        total (int): total to sum up three integers in l to
+
+    Returns:
+        int: product of the three integers that sum up to total
+    """
+    counts = _bounded_counts(l, total, 3)
+    firsts = np.flatnonzero(counts).tolist() if np is not None else [n for n in range(total+1) if counts[n]]
+    for a in firsts:
+        rest = total - a
+        counts[a] -= 1 # a cannot be used again as second or third int
+        if np is not None:
+            row = counts[:rest+1]
+            found = (row > 0) & (row[::-1] > 0)
+            if rest % 2 == 0:
+                found[rest//2] &= row[rest//2] > 1
+            candidates = np.flatnonzero(found)
+            b = int(candidates[0]) if candidates.size else None
+        else:
+            b = next((b for b in range(rest//2 + 1)
+                      if counts[b] and counts[rest - b] and (2*b != rest or counts[b] > 1)), None)
+        counts[a] += 1
+        if b is not None:
+            return a * b * (rest - b)
+
+
+def find_k_ints_summing_to(l: List[int], total: int, k: int,
+                           all_solutions: bool = False) -> Union[Optional[Tuple[int, ...]], List[Tuple[int, ...]]]:
+    """Find k ints in list that sum to total
+
+    Works on the sorted distinct ints, with their number of occurrences, so that
+    an int is used at most as many times as it occurs in l. Combinations are
+    built in non-decreasing order, pruning ints too large or too small to reach
+    total. The last two ints are found by a two-pointer search, and for k >= 4
+    the last two ints are instead looked up in an index of pair sums
+    (meet-in-the-middle).
+
+    Time complexity, for d distinct ints: O(d) for k=2, O(d**2) for k=3 and 4,
+        O(d**(k-2)) for k > 4, plus O(n log n) sorting.
+    Space complexity: O(d), O(d**2) for k >= 4 for the pair sums index.
+
+    Args:
+        l (list): integers
+        total (int): total to sum up k integers in l to
+        k (int): number of integers to sum up
+        all_solutions (bool, optional): whether to return all combinations
+            instead of the first one found. Defaults to False.
+
+    Returns:
+        Union[Optional[Tuple[int, ...]], List[Tuple[int, ...]]]: k integers
+            summing up to total, in non-decreasing order, or None if there are none.
+            If all_solutions, list of all distinct such tuples.
+    """
+    if k < 1:
+        raise ValueError(f"k must be positive, got {k}")
+    if not l:
+        return [] if all_solutions else None
+
+    counts = Counter(l)
+    values = sorted(counts)
+    index = {v: i for i, v in enumerate(values)}
+    pair_sums = _index_pair_sums(values, counts, total, k) if k >= 4 else None
+
+    solutions = _k_sums(values, counts, index, pair_sums, total, k, 0, ())
+    if all_solutions:
+        return list(solutions)
+    return next(solutions, None)
+
+
+def _available(counts: Counter, prefix: Tuple[int, ...], *ints: int) -> bool:
+    """Whether ints can be added to prefix, without using an int more times than it occurs"""
+    needed = Counter(prefix)
+    needed.update(ints)
+    return all(needed[n] <= counts[n] for n in ints)
+
+
+def _index_pair_sums(values: List[int], counts: Counter, total: int, k: int) -> Dict[int, List[int]]:
+    """Index of first value of pairs of values (i <= j), by their sum
+
+    Only sums that can complete k-2 other values to total are indexed. Lists
+    of first values are sorted, so they can be searched by bisection.
+    """
+    low, high = total - (k-2)*values[-1], total - (k-2)*values[0]
+    pair_sums = {}
+    for i, v in enumerate(values):
+        if v + v > high:
+            break
+        j_start = i if counts[v] > 1 else i+1
+        for w in values[j_start:]:
+            s = v + w
+            if s > high:
+                break
+            if s >= low:
+                pair_sums.setdefault(s, []).append(i)
+    return pair_sums
+
+
+def _k_sums(values: List[int], counts: Counter, index: Dict[int, int], pair_sums: Optional[Dict[int, List[int]]],
+            target: int, k: int, start: int, prefix: Tuple[int, ...]) -> Iterator[Tuple[int, ...]]:
+    """Combinations of prefix and k values from values[start:] summing to target"""
+    if k == 1:
+        i = index.get(target)
+        if i is not None and i >= start and _available(counts, prefix, target):
+            yield prefix + (target,)
+
+    elif k == 2:
+        # two-pointer search on sorted values
+        lo, hi = start, len(values) - 1
+        while lo <= hi:
+            s = values[lo] + values[hi]
+            if s < target:
+                lo += 1
+            elif s > target:
+                hi -= 1
+            else:
+                if _available(counts, prefix, values[lo], values[hi]):
+                    yield prefix + (values[lo], values[hi])
+                lo += 1
+                hi -= 1
+
+    elif k == 4 and pair_sums is not None:
+        # first pair enumerated, second pair (starting at or after the first pair's
+        # second value) looked up by its sum
+        for i in range(start, len(values)):
+            v = values[i]
+            if 4*v > target:
+                break
+            if not _available(counts, prefix, v):
+                continue
+            for j in range(i, len(values)):
+                w = values[j]
+                if v + 3*w > target:
+                    break
+                firsts = pair_sums.get(target - v - w, [])
+                for p in firsts[bisect.bisect_left(firsts, j):]:
+                    x = values[p]
+                    y = target - v - w - x
+                    if _available(counts, prefix, v, w, x, y):
+                        yield prefix + (v, w, x, y)
+
+    else:
+        for i in range(start, len(values)):
+            v = values[i]
+            if k*v > target:
+                break # all remaining values are at least v
+            if v + (k-1)*values[-1] < target:
+                continue # too small even with the largest values
+            if _available(counts, prefix, v):
+                yield from _k_sums(values, counts, index, pair_sums, target - v, k-1, i, prefix + (v,))
+
+
+class SumIndex():
+    """Multiset of ints, indexed to find which of them sum up to many targets
+
+    Ints are counted and their distinct values kept sorted once, then updated
+    incrementally by add and remove, e.g. to slide a window over a list,
+    rather than rebuilt for each query.
+
+    Queries return the ints found in non-decreasing order, or None if there
+    are none:
+        index = SumIndex([1721, 979, 366, 299, 675, 1456])
+        index.pair_sum(2020)    # (299, 1721)
+        index.triple_sum(2020)  # (366, 675, 979)
+    """
+    def __init__(self, ints: Iterable[int] = ()):
+        self.counts = Counter(ints)
+        self.values = sorted(self.counts) # distinct ints
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def __contains__(self, n: int) -> bool:
+        return n in self.counts
+
+    def add(self, n: int):
+        if n not in self.counts:
+            bisect.insort(self.values, n)
+        self.counts[n] += 1
+
+    def remove(self, n: int):
+        """Remove one occurrence of n, raising KeyError if there is none"""
+        if n not in self.counts:
+            raise KeyError(n)
+        self.counts[n] -= 1
+        if self.counts[n] == 0:
+            del self.counts[n]
+            del self.values[bisect.bisect_left(self.values, n)]
+
+    def pair_sum(self, target: int) -> Optional[Tuple[int, int]]:
+        """Two ints summing to target, looking up the complement of each distinct int
+
+        Time complexity: O(d), d distinct ints
+        """
+        for n in self.values:
+            complement = target - n
+            if complement < n:
+                break # pairs are found from their smallest int
+            if complement in self.counts and (complement != n or self.counts[n] > 1):
+                return n, complement
+
+    def triple_sum(self, target: int) -> Optional[Tuple[int, int, int]]:
+        """Three ints summing to target, see find_k_ints_summing_to
+
+        Time complexity: O(d**2), d distinct ints
+        """
+        return next(_k_sums(self.values, self.counts, None, None, target, 3, 0, ()), None)
+
+
+def part1(input_list: List[int]) -> int:
+    """Product of the two entries summing to 2020"""
+    return find_two_ints_summing_to(input_list, 2020)
+
+
+def part2(input_list: List[int]) -> int:
+    """Product of the three entries summing to 2020"""
+    return find_three_ints_summing_to(input_list, 2020)
+
+
+def solve(input_list: List[int]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(input_list), part2(input_list)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,10 @@
 from typing import List, Tuple, Set
 
+from aoc.inputs import Text, as_text, read_input
 
-def parse_input_file(test: int = 0):
-    if not test:
-        with open('./d21_allergen_assessment/input.txt', 'r') as f:
-            lines = f.read().strip().split("\n")
-    else:
-        with open(f'./d21_allergen_assessment/test_input{test}.txt', 'r') as f:
-            lines = f.read().strip().split("\n")
+
+def parse(text: Text) -> List[Tuple[List[str], List[str]]]:
+    lines = as_text(text).strip().split("\n")
 
     food2allergens = []
     for line in lines:
@@ -19,6 +16,10 @@ def parse_input_file(test: int = 0):
     return food2allergens
 
 
+def parse_input_file(test: int = 0) -> List[Tuple[List[str], List[str]]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 
 def get_allergens_ingrs_universe(food2allergens: List[Tuple[List[str], List[str]]]) -> Tuple[List[str], List[str]]:
     """Get all ingrs and allergens from tuples with foods and allergens contained
@@ -134,6 +135,21 @@ def get_canonical_dangerous_ingredient_list(food2allergens: List[Tuple[List[str]
 
 
 
+def part1(food2allergens: List[Tuple[List[str], List[str]]]) -> int:
+    """Occurrences of ingredients that cannot contain any allergen"""
+    return get_n_nonallergens(food2allergens)
+
+
+def part2(food2allergens: List[Tuple[List[str], List[str]]]) -> str:
+    """Canonical dangerous ingredient list"""
+    return get_canonical_dangerous_ingredient_list(food2allergens)
+
+
+def solve(food2allergens: List[Tuple[List[str], List[str]]]) -> Tuple[int, str]:
+    """Answers to both parts"""
+    return part1(food2allergens), part2(food2allergens)
+
+
 if __name__ == "__main__":
     food2allergens = parse_input_file(test=0)
 
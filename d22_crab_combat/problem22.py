@@ -2,18 +2,15 @@ from typing import List, Tuple, Deque, Set
 from collections import deque
 import copy
 
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, trace
+
 Deck = Deque[int]
 
 
-def parse_input_file(test: int = 0) -> Tuple[List[int], List[int]]:
-    if not test:
-        with open('./d22_crab_combat/input.txt', 'r') as f:
-            lines = f.read().strip()
-    else:
-        with open(f'./d22_crab_combat/test_input{test}.txt', 'r') as f:
-            lines = f.read().strip()
+def parse(text: Text) -> Tuple[List[int], List[int]]:
+    lines = as_text(text).strip()
 
-    print(lines)
     p1_txt, p2_txt = lines.split("\n\n")
 
 
@@ -24,6 +21,10 @@ def parse_input_file(test: int = 0) -> Tuple[List[int], List[int]]:
     return p1, p2
 
 
+def parse_input_file(test: int = 0) -> Tuple[List[int], List[int]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 def simulate_combat_game(p1: Deck, p2: Deck) -> Tuple[Deck, Deck]:
     """Simulate 2-player game of Combat, give final decks' configuration.
 
@@ -75,39 +76,64 @@ def simulate_recursive_combat_game(p1: Deck, p2: Deck, seen: Set[Tuple[Deck, Dec
         seen (Set[Tuple[Deck, Deck]]): decks' configurations already encountered in the (sub)game.
             This is necessary to end the (sub)game if it would loop.
 
+    Sub games are played on an explicit stack of games rather than recursively,
+    each game suspended on the round that started a sub game being stored as
+    [p1, p2, seen, (top1, top2), sub_p1_winner], so nesting depth is bounded by
+    memory only. sub_p1_winner is set when the sub game ends.
+
     Returns:
         Tuple[Deck, Deck]: the end decks of Player1 and Player2.
     """
-    # terminate if config already happened (-X-> infinite recursion)
-    while p1 and p2: # while both deques have elements
-        if (tuple(p1), tuple(p2)) in seen:
-            return p1, None # returns p1 winning
-        else:
-            seen.add((tuple(p1), tuple(p2)))
-
-        top1, top2 = p1.popleft(), p2.popleft()
-
-        # if not enough cards, play as normal
-        if top1 > len(p1) or top2 > len(p2):
-            assert top1 != top2, f"Two tops were the same: {top1}"
-            p1_winner = top1 > top2
-        # else recurse
-        else:
-            # copy cards for each deck equal to top card's value
-            p1_copy = deque(list(p1)[:top1])
-            p2_copy = deque(list(p2)[:top2])
-            final_sub_p1, final_sub_p2 = simulate_recursive_combat_game(p1_copy, p2_copy, set())
-            p1_winner = len(final_sub_p1) > 0
-
-        # update based on who won
-        if p1_winner:
-            p1.append(top1)
-            p1.append(top2)
-        else:
-            p2.append(top2)
-            p2.append(top1)
-
-    return p1, p2
+    games = [[p1, p2, seen, None, None]]
+    while True:
+        game = games[-1]
+        p1, p2, seen, tops, _ = game
+        end_decks = p1, p2
+        while tops is not None or (p1 and p2): # while both deques have elements
+            if tops is not None:
+                # resume the round that started the sub game which just ended
+                top1, top2 = tops
+                p1_winner = game[4]
+                tops = game[3] = game[4] = None
+            else:
+                # terminate if config already happened (-X-> infinite loop)
+                if (tuple(p1), tuple(p2)) in seen:
+                    end_decks = p1, None # returns p1 winning
+                    break
+                else:
+                    seen.add((tuple(p1), tuple(p2)))
+
+                top1, top2 = p1.popleft(), p2.popleft()
+
+                # if not enough cards, play as normal
+                if top1 > len(p1) or top2 > len(p2):
+                    assert top1 != top2, f"Two tops were the same: {top1}"
+                    p1_winner = top1 > top2
+                # else play a sub game first, this round is resumed when it ends
+                else:
+                    # copy cards for each deck equal to top card's value
+                    p1_copy = deque(list(p1)[:top1])
+                    p2_copy = deque(list(p2)[:top2])
+                    game[3] = (top1, top2)
+                    games.append([p1_copy, p2_copy, set(), None, None])
+                    end_decks = None
+                    break
+
+            # update based on who won
+            if p1_winner:
+                p1.append(top1)
+                p1.append(top2)
+            else:
+                p2.append(top2)
+                p2.append(top1)
+
+        if end_decks is None:
+            continue # a sub game was started
+
+        games.pop()
+        if not games:
+            return end_decks
+        games[-1][4] = len(end_decks[0]) > 0 # sub game's winner, for the suspended round
 
 
 
@@ -132,7 +158,7 @@ def compute_winning_score(p1: Deck, p2: Deck, recursive: bool = False) -> int:
     else:
         p1, p2 = simulate_combat_game(p1, p2)
     winner_deck = p1 if p1 else p2
-    print(winner_deck)
+    trace(DEBUG, "winner deck: {}", winner_deck)
     score = 0
     for i, card in enumerate(winner_deck):
         score += (len(winner_deck)-i)*card
@@ -140,6 +166,23 @@ def compute_winning_score(p1: Deck, p2: Deck, recursive: bool = False) -> int:
     return score
 
 
+def part1(decks: Tuple[List[int], List[int]]) -> int:
+    """Winning player's score in a game of Combat"""
+    p1, p2 = decks
+    return compute_winning_score(p1, p2)
+
+
+def part2(decks: Tuple[List[int], List[int]]) -> int:
+    """Winning player's score in a game of Recursive Combat"""
+    p1, p2 = decks
+    return compute_winning_score(p1, p2, recursive=True)
+
+
+def solve(decks: Tuple[List[int], List[int]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(decks), part2(decks)
+
+
 if __name__ == "__main__":
     p1, p2 = parse_input_file(test=0)
 
@@ -1,17 +1,18 @@
-from typing import Tuple
+from typing import Tuple, List
 from tqdm import tqdm
 
-def parse_input_file(test = 0):
-    if test:
-        with open(f"./d23_crab_cups/test_input{test}.txt", "r") as f:
-            inp = f.readline()
-    else:
-        with open("./d23_crab_cups/input.txt", "r") as f:
-            inp = f.readline()
+from aoc.inputs import Text, as_text, read_input
+
+def parse(text: Text) -> List[int]:
+    inp = as_text(text).strip()
 
     return [int(digit) for digit in inp]
 
 
+def parse_input_file(test = 0) -> List[int]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 def make_moves(labels: str, n: int = 100, k: int = 3, i: int = 0) -> str:
     """
     Simulate n moves on labels, picking up k cups starting at index i
@@ -67,6 +68,11 @@ def make_move(labels, i: int, k: int, minmax: Tuple[int, int]) -> Tuple[str, int
     return new_labels, i
 
 
+def part1(labels: List[int]) -> str:
+    """Labels after cup 1 once 100 moves are made"""
+    return make_moves(labels, 100)
+
+
 if __name__ == "__main__":
     labels = parse_input_file(test=0)
     print(f"labels:")
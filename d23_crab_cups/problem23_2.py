@@ -1,17 +1,19 @@
 from typing import Tuple, List
 from tqdm import tqdm
 
-def parse_input_file(test = 0):
-    if test:
-        with open(f"./d23_crab_cups/test_input{test}.txt", "r") as f:
-            inp = f.readline()
-    else:
-        with open("./d23_crab_cups/input.txt", "r") as f:
-            inp = f.readline()
+import d23_crab_cups.problem23 as problem23
+from aoc.inputs import Text, as_text, read_input
+
+def parse(text: Text) -> List[int]:
+    inp = as_text(text).strip()
 
     return [int(digit) for digit in inp]
 
 
+def parse_input_file(test = 0) -> List[int]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 
 class LLNode():
     def __init__(self, val: int):
@@ -155,6 +157,20 @@ def make_moves(labels: List[int], n: int = 100, k: int = 3) -> int:
 
 
 
+def part2(labels: List[int]) -> int:
+    """Product of the two cups after cup 1, with one million cups and ten million moves"""
+    ONE_MILLION = 1000000
+    TEN_MILLION = 10000000
+
+    labels2 = labels + list(range(max(labels)+1, ONE_MILLION +1))
+    return make_moves(labels2, TEN_MILLION)
+
+
+def solve(labels: List[int]) -> Tuple[str, int]:
+    """Answers to both parts"""
+    return problem23.part1(labels), part2(labels)
+
+
 if __name__ == "__main__":
     labels = parse_input_file(test=0)
     ONE_MILLION = 1000000
@@ -1,13 +1,11 @@
 from typing import List, Set, Tuple
 from tqdm import tqdm
 
-def parse_input_file(test = 0) -> List[List[str]]:
-    if test:
-        with open(f"./d24_lobby_layout/test_input{test}.txt", "r") as f:
-            lines = f.read().splitlines()
-    else:
-        with open("./d24_lobby_layout/input.txt", "r") as f:
-            lines = f.read().splitlines()
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import INFO, trace
+
+def parse(text: Text) -> List[List[str]]:
+    lines = as_text(text).splitlines()
 
     def parse_line(line: List[str]):
         # construct directions line
@@ -31,6 +29,10 @@ def parse_input_file(test = 0) -> List[List[str]]:
     return ll # list of parsed directions with elements in ["e", "w", "ne", "se", "nw", "sw"]
 
 
+def parse_input_file(test = 0) -> List[List[str]]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 def get_black_tiles(directions_list: List[List[str]]) -> Set[Tuple[int, float]]:
     """Get initial black tiles' configuration
 
@@ -139,12 +141,28 @@ def game_of_life_hex(black_tiles: Set[Tuple[int, int]], n=100) -> Set[Tuple[int,
     # for _ in tqdm(range(n)):
     for i in range(n+1):
         if i%10 == 0:
-            print(f"{i}: {len(black_tiles)}")
+            trace(INFO, "day {}: {} black tiles", i, len(black_tiles))
         # print(len(black_tiles))
         black_tiles = simulate_gol_turn(black_tiles)
     return black_tiles
 
 
+def part1(directions_list: List[List[str]]) -> int:
+    """Number of tiles left black side up by the directions list"""
+    return len(get_black_tiles(directions_list))
+
+
+def part2(directions_list: List[List[str]]) -> int:
+    """Number of black tiles after 100 days of flipping"""
+    init_black_tiles = get_black_tiles(directions_list)
+    return len(game_of_life_hex(init_black_tiles, 100))
+
+
+def solve(directions_list: List[List[str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(directions_list), part2(directions_list)
+
+
 if __name__ == "__main__":
     directions_list = parse_input_file(test=0)
 
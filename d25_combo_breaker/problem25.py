@@ -1,16 +1,18 @@
-def parse_input_file(test: int = 0):
-    if test:
-        with open(f"./d25_combo_breaker/test_input{test}.txt", 'r') as f:
-            card_pk = f.readline()
-            door_pk = f.readline()
-    else:
-        with open("./d25_combo_breaker/input.txt", 'r') as f:
-            card_pk = f.readline()
-            door_pk = f.readline()
+from typing import Optional, Tuple
+
+from aoc.inputs import Text, as_text, read_input
+
+
+def parse(text: Text) -> Tuple[int, int]:
+    card_pk, door_pk = as_text(text).split()[:2]
 
     return int(card_pk), int(door_pk)
 
 
+def parse_input_file(test: int = 0) -> Tuple[int, int]:
+    return parse(read_input(__file__, f"test_input{test}.txt" if test else "input.txt"))
+
+
 def get_loopsize(pk: int, subj_num: int = 7, mod: int = 20201227) -> int:
     val = 1
     loop_size = 0
@@ -39,6 +41,17 @@ def get_hs_enc_key(card_pk: int, door_pk: int):
     return enc_key1
 
 
+def part1(public_keys: Tuple[int, int]) -> int:
+    """Encryption key of the card/door handshake"""
+    card_pk, door_pk = public_keys
+    return get_hs_enc_key(card_pk, door_pk)
+
+
+def solve(public_keys: Tuple[int, int]) -> Tuple[int, Optional[int]]:
+    """Answer to part 1, there is no part 2 on day 25"""
+    return part1(public_keys), None
+
+
 if __name__ == "__main__":
     card_pk, door_pk = parse_input_file(test=0)
 
@@ -1,9 +1,24 @@
-from typing import List, Tuple
+import concurrent.futures
+import os
+import re
+import sys
+from array import array
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
 
-def parse_input_file() -> List[Tuple[int, int, str, str]]:
-    input_path = "./d2_password_philosophy/input.txt"
-    with open(input_path, "r") as file:
-        lines = [k for k in file.read().strip().split("\n")]
+from aoc.inputs import Text, as_text, read_input
+from aoc.pool import bounded_map
+
+try:
+    import numpy as np
+except ImportError: # optional, columns are then checked one password at a time
+    np = None
+
+# a line of the password log: "lo-hi char: password"
+PASSWORD_LINE = re.compile(rb"(\d+)-(\d+) (\S): (\S+)")
+CHUNK_SIZE = 16 * 1024**2 # bytes read at once when streaming a log
+
+def parse(text: Text) -> List[Tuple[int, int, str, str]]:
+    lines = [k for k in as_text(text).strip().split("\n")]
 
     test_cases = []
     for line in lines:
@@ -15,6 +30,10 @@ def parse_input_file() -> List[Tuple[int, int, str, str]]:
     return test_cases
 
 
+def parse_input_file() -> List[Tuple[int, int, str, str]]:
+    return parse(read_input(__file__))
+
+
 
 def validate_passwords_part1(test_cases: List[tuple]) -> int:
     """Given policies and passwords, returns number of valid passwords
@@ -91,7 +110,219 @@ def test_case_passes_part2(test_case: Tuple[int, int, str, str]) -> bool:
     lo, hi, char, s = test_case                 # unpack test case
     return (s[lo-1] == char) ^ (s[hi-1] == char)# use exclusive OR (^) to ensure EXACTLY one
 
+class PasswordColumns():
+    """Policies and passwords stored by column rather than as tuples
+
+    lo and hi are unsigned shorts, policy chars one byte each, and passwords
+    concatenated in a single buffer, password i being
+    passwords[offsets[i]:offsets[i+1]]. This takes a few bytes per password
+    beyond its characters, against 200+ for a tuple of int, int, str, str,
+    and lets test_cases_pass_part1/2 check all passwords at once.
+    Iterating gives the (lo, hi, char, s) tuples of parse:
+        columns = PasswordColumns.from_text("1-3 a: abcde\\n1-3 b: cdefg\\n")
+        test_cases_pass_part1(columns)  # [True, False]
+    """
+    def __init__(self):
+        self.lo = array("H")
+        self.hi = array("H")
+        self.chars = bytearray()
+        self.passwords = bytearray()
+        self.offsets = array("Q", [0])
+
+    @classmethod
+    def from_text(cls, text: Text) -> "PasswordColumns":
+        """Columns of each "lo-hi char: password" line of text"""
+        columns = cls()
+        data = text.encode() if isinstance(text, str) else bytes(text)
+        for match in PASSWORD_LINE.finditer(data):
+            columns.append(int(match[1]), int(match[2]), match[3], match[4])
+        return columns
+
+    @classmethod
+    def from_test_cases(cls, test_cases: Sequence[Tuple[int, int, str, str]]) -> "PasswordColumns":
+        columns = cls()
+        for lo, hi, char, s in test_cases:
+            columns.append(lo, hi, char.encode(), s.encode())
+        return columns
+
+    def append(self, lo: int, hi: int, char: bytes, s: bytes):
+        self.lo.append(lo)
+        self.hi.append(hi)
+        self.chars += char
+        self.passwords += s
+        self.offsets.append(len(self.passwords))
+
+    def __len__(self) -> int:
+        return len(self.lo)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str, str]]:
+        for i in range(len(self)):
+            s = self.passwords[self.offsets[i]:self.offsets[i+1]]
+            yield self.lo[i], self.hi[i], chr(self.chars[i]), s.decode()
+
+
+def test_cases_pass_part1(columns: PasswordColumns) -> Sequence[bool]:
+    """Given columns of test cases, determines which are passed for part1
+
+    Vectorized test_case_passes_part1: with numpy, each password byte is
+    compared to its policy char at once, and matches summed per password by
+    differences of their cumulative sum at the password offsets.
+
+    Args:
+        columns (PasswordColumns): test cases
+
+    Returns:
+        Sequence[bool]: whether each test case is passed, as a numpy array if
+            numpy is available, a list otherwise
+    """
+    if np is None:
+        passwords, offsets, chars = columns.passwords, columns.offsets, columns.chars
+        return [lo <= passwords.count(chars[i], offsets[i], offsets[i+1]) <= hi
+                for i, (lo, hi) in enumerate(zip(columns.lo, columns.hi))]
+
+    offsets = np.frombuffer(columns.offsets, dtype=np.uint64).astype(np.int64)
+    lengths = np.diff(offsets)
+    chars = np.frombuffer(columns.chars, dtype=np.uint8)
+    matches = np.frombuffer(columns.passwords, dtype=np.uint8) == np.repeat(chars, lengths)
+    cumulative = np.concatenate(([0], np.cumsum(matches)))
+    counts = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+    lo = np.frombuffer(columns.lo, dtype=np.uint16)
+    hi = np.frombuffer(columns.hi, dtype=np.uint16)
+    return (lo <= counts) & (counts <= hi)
+
+
+def test_cases_pass_part2(columns: PasswordColumns) -> Sequence[bool]:
+    """Given columns of test cases, determines which are passed for part2
+
+    Vectorized test_case_passes_part2. Positions before the start (0) or past
+    the end of a password do not hold its char, as in
+    count_valid_passwords_chunk.
+
+    Args:
+        columns (PasswordColumns): test cases
+
+    Returns:
+        Sequence[bool]: whether each test case is passed, as a numpy array if
+            numpy is available, a list otherwise
+    """
+    if np is None:
+        passwords, offsets, chars = columns.passwords, columns.offsets, columns.chars
+        def at(i: int, position: int) -> bool:
+            index = offsets[i] + position - 1
+            return position >= 1 and index < offsets[i+1] and passwords[index] == chars[i]
+        return [at(i, lo) ^ at(i, hi) for i, (lo, hi) in enumerate(zip(columns.lo, columns.hi))]
+
+    offsets = np.frombuffer(columns.offsets, dtype=np.uint64).astype(np.int64)
+    starts, lengths = offsets[:-1], np.diff(offsets)
+    passwords = np.frombuffer(columns.passwords, dtype=np.uint8)
+    chars = np.frombuffer(columns.chars, dtype=np.uint8)
+    def at(positions: "np.ndarray") -> "np.ndarray":
+        positions = positions.astype(np.int64)
+        inside = (positions >= 1) & (positions <= lengths)
+        indices = np.where(inside, starts + positions - 1, 0)
+        return inside & (passwords[indices] == chars) if len(passwords) else inside
+    return at(np.frombuffer(columns.lo, dtype=np.uint16)) ^ at(np.frombuffer(columns.hi, dtype=np.uint16))
+
+
+def iter_line_chunks(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file in chunks of about chunk_size bytes, each ending at a line end
+
+    Args:
+        file (BinaryIO): file opened in binary mode
+        chunk_size (int, optional): bytes to read at once. Defaults to CHUNK_SIZE.
+
+    Yields:
+        bytes: chunk of whole lines
+    """
+    rest = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        chunk = rest + chunk
+        end = chunk.rfind(b"\n") + 1
+        rest = chunk[end:] # partial last line, completed by the next chunk
+        if end:
+            yield chunk[:end]
+    if rest:
+        yield rest
+
+
+def count_valid_passwords_chunk(chunk: bytes) -> Tuple[int, int]:
+    """Given a chunk of password log, returns number of valid passwords for both parts
+
+    Lines are matched by PASSWORD_LINE, and both policies checked on each
+    match, in a single pass over the chunk.
+
+    Args:
+        chunk (bytes): whole lines of the password log
+
+    Returns:
+        Tuple[int, int]: number of passwords valid for part1 and part2 policies
+    """
+    count1 = count2 = 0
+    for match in PASSWORD_LINE.finditer(chunk):
+        lo, hi, char, s = int(match[1]), int(match[2]), match[3], match[4]
+        count1 += lo <= s.count(char) <= hi
+        # slices, as indexing bytes gives ints
+        count2 += (s[lo-1:lo] == char) ^ (s[hi-1:hi] == char)
+    return count1, count2
+
+
+def count_valid_passwords_streaming(path: str, chunk_size: int = CHUNK_SIZE,
+                                    jobs: Optional[int] = None) -> Tuple[int, int]:
+    """Number of valid passwords for both parts in a password log of any size
+
+    The log is read in chunks, so memory use does not depend on its size.
+    With jobs, chunks are counted on a pool of processes, with at most two
+    chunks per process in flight.
+
+    Args:
+        path (str): password log file
+        chunk_size (int, optional): bytes read at once. Defaults to CHUNK_SIZE.
+        jobs (Optional[int], optional): number of processes, 0 for the number
+            of CPUs. Defaults to None, counting in the current process.
+
+    Returns:
+        Tuple[int, int]: number of passwords valid for part1 and part2 policies
+    """
+    count1 = count2 = 0
+    with open(path, "rb") as file:
+        chunks = iter_line_chunks(file, chunk_size)
+        if jobs is None:
+            for chunk in chunks:
+                c1, c2 = count_valid_passwords_chunk(chunk)
+                count1, count2 = count1 + c1, count2 + c2
+            return count1, count2
+
+        jobs = jobs or os.cpu_count()
+        with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+            for c1, c2 in bounded_map(pool, count_valid_passwords_chunk, chunks, 2 * jobs):
+                count1, count2 = count1 + c1, count2 + c2
+    return count1, count2
+
+
+def part1(test_cases: List[Tuple[int, int, str, str]]) -> int:
+    """Number of passwords valid under the occurrences range policy"""
+    return validate_passwords_part1(test_cases)
+
+
+def part2(test_cases: List[Tuple[int, int, str, str]]) -> int:
+    """Number of passwords valid under the exclusive positions policy"""
+    return validate_passwords_part2(test_cases)
+
+
+def solve(test_cases: List[Tuple[int, int, str, str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(test_cases), part2(test_cases)
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1: # stream a log of any size: python -m d2_password_philosophy.problem2 LOG [JOBS]
+        jobs = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        print(*count_valid_passwords_streaming(sys.argv[1], jobs=jobs), sep="\n")
+        sys.exit()
+
     test_cases = parse_input_file()
 
     ans1 = validate_passwords_part1(test_cases)
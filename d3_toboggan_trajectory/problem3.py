@@ -1,11 +1,111 @@
-from typing import List, Tuple
+import mmap
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from aoc.inputs import Text, as_text, input_path, read_input
+
+try:
+    import numpy as np
+except ImportError: # optional, slope tables are then summed one slope at a time
+    np = None
+
+def parse(text: Text) -> List[str]:
+    return as_text(text).strip().split("\n")
+
 
 def parse_input_file() -> List[str]:
-    input_path = "./d3_toboggan_trajectory/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.read().strip().split("\n")
+    return parse(read_input(__file__))
+
+
+class MappedRow():
+    """Row of a MappedLandscape, reading its cells from the file when indexed"""
+    def __init__(self, buffer: mmap.mmap, start: int, length: int):
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, x: int) -> str:
+        if not 0 <= x < self.length:
+            raise IndexError(f"column {x} out of row of width {self.length}")
+        return chr(self.buffer[self.start + x])
+
+    def __str__(self) -> str:
+        return self.buffer[self.start:self.start + self.length].decode()
+
+
+class MappedLandscape():
+    """Landscape read from a memory-mapped file, for grids larger than memory
+
+    Row offsets are computed once on opening: if all rows have the same width,
+    as they should, they are a range and take no memory, otherwise they are
+    found line by line. As when reading the file as text, rows of CRLF files
+    end before the carriage return. Indexing a row then a column reads a
+    single byte of the file, so that count_trees_in_path only reads the cells
+    on its path:
+        with MappedLandscape.open("huge_landscape.txt") as landscape:
+            count_trees_in_path(landscape, (1, 3))
+    """
+    ROWS_CHECKED = 1 << 20 # rows whose line ends are checked at once for a fixed width
 
-    return lines
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        self.end = len(buffer) # end of the last row, ignoring trailing whitespace
+        while self.end and buffer[self.end - 1] in b" \r\n":
+            self.end -= 1
+        self.offsets = self._row_offsets()
+
+    @classmethod
+    def open(cls, path: Optional[str] = None) -> "MappedLandscape":
+        """Map a landscape file, by default the day's input file"""
+        with open(path or input_path(__file__), "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _row_offsets(self) -> Sequence[int]:
+        """Start of each row"""
+        buffer, end = self.buffer, self.end
+        if not end:
+            return range(0)
+        W = buffer.find(b"\n", 0, end)
+        if W < 0:
+            return range(1)
+        stride = W + 1
+        if end % stride == W: # may be a fixed width: check every line end, a chunk at a time
+            line_ends = range(W, end, stride)
+            for i in range(0, len(line_ends), self.ROWS_CHECKED):
+                chunk = line_ends[i:i + self.ROWS_CHECKED]
+                if buffer[chunk.start:chunk.stop:stride].count(b"\n") != len(chunk):
+                    break
+            else:
+                return range(0, end, stride)
+
+        offsets = array("Q", [0])
+        start = buffer.find(b"\n", 0, end) + 1
+        while start:
+            offsets.append(start)
+            start = buffer.find(b"\n", start, end) + 1
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, y: int) -> MappedRow:
+        start = self.offsets[y]
+        stop = self.offsets[y + 1] - 1 if y + 1 < len(self.offsets) else self.end
+        if stop > start and self.buffer[stop - 1] == ord("\r"):
+            stop -= 1
+        return MappedRow(self.buffer, start, stop - start)
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self) -> "MappedLandscape":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 def count_trees_in_path(landscape: List[str], increments: Tuple[int]) -> int:
@@ -40,6 +140,93 @@ def count_trees_in_path(landscape: List[str], increments: Tuple[int]) -> int:
     return count
 
 
+def count_trees_in_columns(rows: List[str], W: int) -> List[int]:
+    """Number of trees ('#') in each of the W columns of rows"""
+    joined = "".join(rows)
+    return [joined[x::W].count('#') for x in range(W)]
+
+
+class TreeIndex():
+    """Trees of a landscape indexed to count the trees of many slopes
+
+    Going down a slope, its k-th row is at column k*inc_x % W, which only
+    depends on k % W. So for each vertical increment inc_y, rows are grouped
+    once by k % W (rows r*inc_y, r*inc_y + inc_y*W, ...) and their trees
+    counted by column, in trees(inc_y)[r][x]. The trees of any slope with
+    that inc_y are then the sum of W of these counts, whatever the height of
+    the landscape, and slope_table gathers them for all inc_x at once.
+
+    Counts take W*W ints per vertical increment: for landscapes wider than
+    they are high, or not held in memory (MappedLandscape), paths are walked
+    instead.
+        index = TreeIndex(parse_input_file())
+        index.count((1, 3))             # == count_trees_in_path(landscape, (1, 3))
+        index.best_slope(max_y=4, max_x=30)
+    """
+    def __init__(self, landscape: List[str]):
+        self.landscape = landscape
+        self.H, self.W = len(landscape), len(landscape[0])
+        self.walk = self.W * self.W > self.H or isinstance(landscape, MappedLandscape)
+        self._trees: Dict[int, Any] = {} # inc_y: trees[k % W][column]
+
+    def trees(self, inc_y: int) -> Any:
+        """Trees by k % W and column of rows k*inc_y, as a (W, W) numpy array if
+        numpy is available, a list of lists otherwise"""
+        if inc_y not in self._trees:
+            W = self.W
+            trees = [count_trees_in_columns(self.landscape[r*inc_y::inc_y*W], W) for r in range(W)]
+            self._trees[inc_y] = np.array(trees) if np is not None else trees
+        return self._trees[inc_y]
+
+    def count(self, increments: Tuple[int, int]) -> int:
+        """Number of trees in the path given by increments, as count_trees_in_path"""
+        return self.count_row(increments[0], [increments[1]])[0]
+
+    def count_row(self, inc_y: int, xs_increments: List[int]) -> List[int]:
+        """Number of trees in the paths of vertical increment inc_y and each of
+        the horizontal increments"""
+        if self.walk:
+            return [count_trees_in_path(self.landscape, (inc_y, inc_x)) for inc_x in xs_increments]
+        W, trees = self.W, self.trees(inc_y)
+        if np is None:
+            return [sum(trees[r][r*inc_x % W] for r in range(W)) for inc_x in xs_increments]
+        rs = np.arange(W)
+        columns = np.outer(np.asarray(xs_increments) % W, rs) % W # column of row k % W of each slope
+        return trees[rs, columns].sum(axis=1).tolist()
+
+    def slope_table(self, max_y: int, max_x: int) -> Dict[Tuple[int, int], int]:
+        """Number of trees of every slope (inc_y, inc_x), 1 <= inc_y <= max_y
+        and 0 <= inc_x <= max_x"""
+        table = {}
+        xs_increments = list(range(max_x + 1))
+        for inc_y in range(1, max_y + 1):
+            table.update(zip(((inc_y, inc_x) for inc_x in xs_increments), self.count_row(inc_y, xs_increments)))
+        return table
+
+    def best_slope(self, max_y: int, max_x: int) -> Tuple[Tuple[int, int], int]:
+        """Slope of slope_table encountering the fewest trees (the smallest
+        slope on ties), and its number of trees"""
+        table = self.slope_table(max_y, max_x)
+        return min(table.items(), key=lambda item: (item[1], item[0]))
+
+
+def count_trees_in_paths(landscape: List[str], slopes_increments: List[tuple]) -> List[int]:
+    """Count number of trees in the paths of all given slopes at once
+
+    Equivalent to count_trees_in_path for each slope, through a TreeIndex
+    of the landscape, built once.
+
+    Args:
+        landscape (List[str]): input of problem, as for count_trees_in_path
+        slopes_increments (List[tuple]): y, x increments of each slope
+
+    Returns:
+        List[int]: number of trees ('#') in the path of each slope
+    """
+    index = TreeIndex(landscape)
+    return [index.count(increments) for increments in slopes_increments]
+
+
 def multiply_trees_in_paths(landscape: List[str], slopes_increments: List[tuple]) -> int:
     """Multiplies numbers of trees encountered through each of given slopes
 
@@ -61,11 +248,31 @@ def multiply_trees_in_paths(landscape: List[str], slopes_increments: List[tuple]
         int: product of trees encountered through each slopes.
     """
     prod = 1
-    for increments in slopes_increments:
-        prod *= count_trees_in_path(landscape, increments)
+    for count in count_trees_in_paths(landscape, slopes_increments):
+        prod *= count
     return prod
 
 
+def part1(landscape: List[str]) -> int:
+    """Trees encountered going down 1, right 3"""
+    return count_trees_in_path(landscape, (1, 3))
+
+
+def part2(landscape: List[str]) -> int:
+    """Product of trees encountered through each of the five part 2 slopes"""
+    slopes_increments = [(1, 1),
+                         (1, 3),
+                         (1, 5),
+                         (1, 7),
+                         (2, 1),]
+    return multiply_trees_in_paths(landscape, slopes_increments)
+
+
+def solve(landscape: List[str]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(landscape), part2(landscape)
+
+
 if __name__ == "__main__":
     #
     # Part 1
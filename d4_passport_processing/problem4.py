@@ -1,19 +1,52 @@
-from typing import List, Dict
+import concurrent.futures
+import os
+import re
+from collections import Counter
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple
+
+from aoc.inputs import Text, as_text, read_input
+from aoc.pool import bounded_map
+from aoc.trace import WARNING, trace
+
+
+def parse(text: Text) -> List[Dict[str, str]]:
+    return list(iter_passports(as_text(text).split("\n")))
+
+
+def iter_passports(lines: Iterable[Text]) -> Iterator[Dict[str, str]]:
+    """Passports of a stream of lines, yielded as soon as each is complete
+
+    Passports are separated by blank lines, and their 'field:value' pairs
+    separated by spaces or newlines. Lines can come from anything iterable,
+    e.g. a file opened in text or binary mode, which is then read a buffer
+    at a time: passports spanning buffers are completed by the next lines,
+    and only the current passport is held in memory:
+        with open("passports.txt", "rb") as f:
+            validate_passports2(iter_passports(f))
+
+    Args:
+        lines (Iterable[Text]): lines of passports, as str or bytes
+
+    Yields:
+        Dict[str, str]: passport, key is a field and value its str value
+    """
+    passport = {}
+    for line in lines:
+        fields = as_text(line).split()
+        if fields:
+            passport.update(field.split(':', 1) for field in fields)
+        elif passport: # blank line ends the passport
+            yield passport
+            passport = {}
+    if passport:
+        yield passport
 
 
 def parse_input_file() -> List[Dict[str, str]]:
-    input_path = "./d4_passport_processing/input.txt"
-    with open(input_path, "r") as file:
-        passports_str = file.read().strip().split("\n\n")
-        passports = []
-        for passport_str in passports_str:
-            passport_str = passport_str.replace('\n', ' ') # remove newlines and replace with space for split
-            new_passport = {field.split(':')[0]:field.split(':')[1] for field in passport_str.split()}
-            passports.append(new_passport)
-    return passports
-
-
-def validate_passports1(passports: List[Dict[str, str]]) -> int:
+    return parse(read_input(__file__))
+
+
+def validate_passports1(passports: Iterable[Dict[str, str]]) -> int:
     """Count number of valid passports
 
     Valid passports have all required fields:
@@ -22,8 +55,9 @@ def validate_passports1(passports: List[Dict[str, str]]) -> int:
         'cid' is optional.
 
     Args:
-        passports (List[Dict[str: str]]): contains dict where key is
-            a passport field and value its str value.
+        passports (Iterable[Dict[str: str]]): contains dict where key is
+            a passport field and value its str value, e.g. a list, or
+            passports streamed by iter_passports.
 
     Returns:
         int: number of valid passports
@@ -59,7 +93,7 @@ def is_valid_passport1(passport: Dict[str, str]) -> bool:
 
 
 
-def validate_passports2(passports: List[Dict[str, str]]) -> int:
+def validate_passports2(passports: Iterable[Dict[str, str]]) -> int:
     """Count number of valid passports
 
     Valid passports have all required fields:
@@ -81,8 +115,9 @@ def validate_passports2(passports: List[Dict[str, str]]) -> int:
 
 
     Args:
-        passports (List[Dict[str: str]]): contains dict where key is
-            a passport field and value its str value.
+        passports (Iterable[Dict[str: str]]): contains dict where key is
+            a passport field and value its str value, e.g. a list, or
+            passports streamed by iter_passports.
 
     Returns:
         int: number of valid passports
@@ -122,59 +157,217 @@ def is_valid_passport2(passport: Dict[str, str]) -> bool:
     Returns:
         bool: if given passport is valid
     """
-    required_fields = ['ecl', 'pid', 'eyr', 'hcl', 'byr', 'iyr', 'hgt']
-    for field in required_fields:
-        value = passport.get(field, None)
-        if value is None or not is_valid_field(field, value):
-            return False
-
-    return True
+    return check_passport(passport)[1]
 
 def is_valid_field(field: str, value: str) -> bool:
     """Checks whether a value is valid for a given field
 
-    Simple case distinction. Rather long, given the number
-    of cases and specific way to handle each.
-
     Args:
         field (str): given field to check validity of value against
         value (str): value associated to given field
 
     Returns:
-        bool: whether value is valid for given field
+        bool: whether value is valid for given field, False for unknown fields
+    """
+    validator = FIELD_VALIDATORS.get(field)
+    if validator is None:
+        trace(WARNING, "Unknown field: {}\twith value: {}", field, value)
+        return False
+    return validator(value)
+
+def compile_field_rule(pattern: str, ranges: Dict[Optional[str], Tuple[int, int]]) -> Callable[[str], bool]:
+    """Compiles a rule of PASSPORT_SCHEMA into a function checking a value
+
+    Args:
+        pattern (str): regex the whole value must match
+        ranges (Dict[Optional[str], Tuple[int, int]]): inclusive range of the
+            int matched by the pattern's first group, by the unit matched by
+            its second group, or None if it has none. Empty if no int to check.
+
+    Returns:
+        Callable[[str], bool]: whether a value is valid, parsing its int once
+    """
+    regex = re.compile(pattern)
+    if not ranges:
+        return lambda value: regex.fullmatch(value) is not None
+
+    if regex.groups < 2:
+        lo, hi = ranges[None]
+        def is_valid(value: str) -> bool:
+            match = regex.fullmatch(value)
+            return match is not None and lo <= int(match[1]) <= hi
+    else:
+        def is_valid(value: str) -> bool:
+            match = regex.fullmatch(value)
+            if match is None:
+                return False
+            lo, hi = ranges[match[2]]
+            return lo <= int(match[1]) <= hi
+    return is_valid
+
+def check_passport(passport: Dict[str, str]) -> Tuple[bool, bool]:
+    """Check if given passport is valid for part 1 and for part 2, in one pass
+
+    Stops at the first missing field, and stops validating values at the
+    first invalid one.
+
+    Args:
+        passport (Dict[str: str]): key is a passport field
+            and value its str value.
+
+    Returns:
+        Tuple[bool, bool]: if given passport is valid as in is_valid_passport1
+            and as in is_valid_passport2
+    """
+    valid_values = True
+    for field in REQUIRED_FIELDS:
+        value = passport.get(field)
+        if value is None:
+            return False, False
+        if valid_values and not FIELD_VALIDATORS[field](value):
+            valid_values = False
+    return True, valid_values
+
+def validate_passports(passports: Iterable[Dict[str, str]]) -> Tuple[int, int]:
+    """Count number of valid passports for both parts, in a single pass
+
+    Args:
+        passports (Iterable[Dict[str: str]]): as for validate_passports1/2
+
+    Returns:
+        Tuple[int, int]: numbers of valid passports for part 1 and part 2
     """
-    if field == 'byr': # (Birth Year) - four digits; at least 1920 and at most 2002.
-        return len(value) == 4 and int(value) >= 1920 and int(value) <= 2002
+    count1 = count2 = 0
+    for passport in passports:
+        valid1, valid2 = check_passport(passport)
+        count1 += valid1
+        count2 += valid2
+    return count1, count2
 
-    elif field == 'iyr': # (Issue Year) - four digits; at least 2010 and at most 2020.
-        return len(value) == 4 and int(value) >= 2010 and int(value) <= 2020
+def passport_rejection(passport: Dict[str, str]) -> Optional[str]:
+    """Why given passport is invalid for part 2, if it is
+
+    Args:
+        passport (Dict[str: str]): key is a passport field
+            and value its str value.
+
+    Returns:
+        Optional[str]: None if the passport is valid, otherwise the first
+            required field failing, as 'field:missing', 'field:format' (its
+            value doesn't match the schema's regex) or 'field:range' (its int
+            is out of range)
+    """
+    for field in REQUIRED_FIELDS:
+        value = passport.get(field)
+        if value is None:
+            return f"{field}:missing"
+        if not FIELD_VALIDATORS[field](value):
+            return f"{field}:format" if FIELD_PATTERNS[field].fullmatch(value) is None else f"{field}:range"
+    return None
 
-    elif field == 'eyr': # (Expiration Year) - four digits; at least 2020 and at most 2030.
-        return len(value) == 4 and int(value) >= 2020 and int(value) <= 2030
+def count_rejections(passports: Iterable[Dict[str, str]]) -> Tuple[int, Counter]:
+    """Count number of valid passports for part 2, and why the others are invalid
 
-    elif field == 'hgt': # (Height) - a number followed by either cm or in:
-        value, unit = value[:-2], value[-2:]
-        if unit == 'cm': #If cm, the number must be at least 150 and at most 193.
-            return int(value) >= 150 and int(value) <= 193
+    Args:
+        passports (Iterable[Dict[str: str]]): as for validate_passports2
 
-        if unit == 'in': # If in, the number must be at least 59 and at most 76.
-            return int(value) >= 59 and int(value) <= 76
+    Returns:
+        Tuple[int, Counter]: number of valid passports, and number of invalid
+            passports by rejection (see passport_rejection)
+    """
+    count, rejections = 0, Counter()
+    for passport in passports:
+        rejection = passport_rejection(passport)
+        if rejection is None:
+            count += 1
         else:
-            return False
+            rejections[rejection] += 1
+    return count, rejections
+
+def iter_passport_shards(lines: Iterable[Text], shard_lines: int) -> Iterator[List[Text]]:
+    """Group lines of passports into shards of whole passports
 
-    elif field == 'hcl': # hcl (Hair Color) - a # followed by exactly six characters 0-9 or a-f.
-        return value[0] == '#' and len(value[1:]) == 6 and (value[1:].isnumeric() or (value[1:].islower() and value[1:].isalnum()))
+    Args:
+        lines (Iterable[Text]): lines of passports, as for iter_passports
+        shard_lines (int): lines after which a shard ends, at the next blank line
 
-    elif field == 'ecl': # ecl (Eye Color) - exactly one of: amb blu brn gry grn hzl oth.
-        return value in ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+    Yields:
+        List[Text]: lines of at least shard_lines lines, or of the last passports
+    """
+    shard = []
+    for line in lines:
+        shard.append(line)
+        if len(shard) >= shard_lines and not line.strip():
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+def _count_shard_rejections(shard: List[Text]) -> Tuple[int, Counter]:
+    return count_rejections(iter_passports(shard))
+
+def validate_passports2_parallel(lines: Iterable[Text], jobs: int = 0,
+                                 shard_lines: int = 50000) -> Tuple[int, Counter]:
+    """Count number of valid passports for part 2 on a pool of processes
+
+    Lines are sent to the processes in shards of whole passports, each
+    process parsing and validating its shards, as sending parsed passports
+    would cost more than validating them. At most two shards per process are
+    in flight, so that passport dumps of any size are validated in constant
+    memory. Rejections of all shards are merged, as they are counted in the
+    same pass:
+        with open("passports.txt", "rb") as f:
+            count, rejections = validate_passports2_parallel(f)
 
-    elif field == 'pid': # pid (Passport ID) - a nine-digit number, including leading zeroes.
-        return len(value) == 9 and value.isnumeric()
+    Args:
+        lines (Iterable[Text]): lines of passports, as for iter_passports
+        jobs (int, optional): number of processes. Defaults to 0, the number of CPUs.
+        shard_lines (int, optional): lines per shard. Defaults to 50000.
+
+    Returns:
+        Tuple[int, Counter]: as count_rejections
+    """
+    jobs = jobs or os.cpu_count()
+    count, rejections = 0, Counter()
+    with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+        shards = iter_passport_shards(lines, shard_lines)
+        for shard_count, shard_rejections in bounded_map(pool, _count_shard_rejections, shards, 2 * jobs):
+            count += shard_count
+            rejections.update(shard_rejections)
+    return count, rejections
+
+
+# validation rules of part 2: field: (regex of the whole value, inclusive range
+# of the int of its first group by the unit of its second group, if any)
+PASSPORT_SCHEMA: Dict[str, Tuple[str, Dict[Optional[str], Tuple[int, int]]]] = {
+    'byr': (r"([0-9]{4})", {None: (1920, 2002)}),
+    'iyr': (r"([0-9]{4})", {None: (2010, 2020)}),
+    'eyr': (r"([0-9]{4})", {None: (2020, 2030)}),
+    'hgt': (r"([0-9]+)(cm|in)", {'cm': (150, 193), 'in': (59, 76)}),
+    'hcl': (r"#[0-9a-f]{6}", {}),
+    'ecl': (r"amb|blu|brn|gry|grn|hzl|oth", {}),
+    'pid': (r"[0-9]{9}", {}),
+    'cid': (r".*", {}),
+}
+REQUIRED_FIELDS = ('ecl', 'pid', 'eyr', 'hcl', 'byr', 'iyr', 'hgt')
+FIELD_VALIDATORS = {field: compile_field_rule(*rule) for field, rule in PASSPORT_SCHEMA.items()}
+FIELD_PATTERNS = {field: re.compile(pattern) for field, (pattern, _) in PASSPORT_SCHEMA.items()}
+
+
+def part1(passports: List[Dict[str, str]]) -> int:
+    """Number of passports with all required fields"""
+    return validate_passports1(passports)
+
+
+def part2(passports: List[Dict[str, str]]) -> int:
+    """Number of passports with all required fields holding valid values"""
+    return validate_passports2(passports)
+
+
+def solve(passports: List[Dict[str, str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return validate_passports(passports)
 
-    elif field == 'cid': # cid (Country ID) - ignored, missing or not.
-        return True
-    else:
-        print(f"Unknown field: {field}\twith value: {value}")
 
 if __name__ == "__main__":
     passports = parse_input_file()
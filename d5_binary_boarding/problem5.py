@@ -1,11 +1,21 @@
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+
+from aoc.inputs import Text, as_text, input_path, read_input
+
+try:
+    import numpy as np
+except ImportError: # optional, ids are then decoded with decode_bpasses
+    np = None
+
+def parse(text: Text) -> List[str]:
+    return as_text(text).strip().split("\n")
+
 
 def parse_input_file() -> List[str]:
-    input_path = "./d5_binary_boarding/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.read().strip().split("\n")
+    return parse(read_input(__file__))
 
-    return lines
+# B, R -> 1 and F, L -> 0
+_BPASS_BITS = str.maketrans("FBLR", "0101")
 
 def binarize_bpass(bpass: str) -> str:
     """Turn boarding pass into binary number
@@ -17,7 +27,114 @@ def binarize_bpass(bpass: str) -> str:
         str: binarized string where 'B' and 'R' are converted to 1,
             'F', 'L' are converted to 0.
     """
-    return ''.join([str(int(k in ['B', 'R'])) for k in bpass])
+    return bpass.translate(_BPASS_BITS)
+
+def decode_bpasses(bpasses: List[str]) -> List[int]:
+    """Given bpasses, returns their ids
+
+    All bpasses are binarized at once, by a single translate of their
+    joined string.
+
+    Args:
+        bpasses (List[str]): contains bpasses of format e.g. BFFFBBFRRR
+
+    Returns:
+        List[int]: id of each bpass
+    """
+    if not bpasses:
+        return []
+    return [int(bits, 2) for bits in "\n".join(bpasses).translate(_BPASS_BITS).split("\n")]
+
+def bpass_ids_range(bpasses: List[str]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Given bpasses, returns min and max ids, and the first id missing between them
+
+    Ids are decoded in bulk, and marked in a bytearray from min to max id
+    rather than added to a set, the first unmarked one being the missing id,
+    whatever the duplicate ids or number of gaps.
+
+    Args:
+        bpasses (List[str]): contains bpasses of format e.g. BFFFBBFRRR
+
+    Returns:
+        Tuple[Optional[int], Optional[int], Optional[int]]: min id, max id,
+            and missing id, None if no id is missing between min and max.
+            All None if there are no bpasses.
+    """
+    ids = decode_bpasses(bpasses)
+    if not ids:
+        return None, None, None
+    min_bpass_id, max_bpass_id = min(ids), max(ids)
+
+    occupied = bytearray(max_bpass_id - min_bpass_id + 1)
+    for bpass_id in ids:
+        occupied[bpass_id - min_bpass_id] = 1
+    gap = occupied.find(0)
+    missing = min_bpass_id + gap if gap != -1 else None
+    return min_bpass_id, max_bpass_id, missing
+
+def load_bpass_ids(path: Optional[str] = None) -> Sequence[int]:
+    """Ids of the bpasses of a file, one per line, by default the day's input file
+
+    With numpy, bpasses must be fixed-width records: the file is read as one
+    array of bytes, reshaped to a row per bpass including its newline, and
+    all ids computed by a single product of the rows' B/R mask with powers
+    of two. Either way, line ends may be '\\n' or '\\r\\n', and ValueError
+    is raised for chars other than B, F, L, R.
+
+    Args:
+        path (Optional[str], optional): file of bpasses. Defaults to None,
+            the day's input file.
+
+    Returns:
+        Sequence[int]: id of each bpass, as a numpy array if numpy is
+            available, a list otherwise
+    """
+    with open(path or input_path(__file__), "rb") as file:
+        data = file.read().replace(b"\r\n", b"\n").strip()
+    if np is None:
+        return decode_bpasses(data.decode().split())
+    if not data:
+        return np.zeros(0, dtype=np.int64)
+
+    data += b"\n"
+    width = data.index(b"\n") + 1
+    records = np.frombuffer(data, dtype=np.uint8)
+    if len(data) % width or (records[width - 1::width] != ord("\n")).any():
+        raise ValueError(f"bpasses are not fixed-width records of {width - 1} chars")
+    records = records.reshape(-1, width)[:, :-1]
+    ones = (records == ord("B")) | (records == ord("R"))
+    if not (ones | (records == ord("F")) | (records == ord("L"))).all():
+        raise ValueError("bpasses must only contain B, F, L and R")
+    return ones.astype(np.int64) @ (1 << np.arange(width - 2, -1, -1, dtype=np.int64))
+
+def find_missing_bpass_ids(bpass_ids: Sequence[int]) -> List[int]:
+    """Given bpass ids, returns the missing ids whose both neighbour ids are present
+
+    Ids are marked in a seat occupancy bitmap from min to max id, whose gaps
+    are then found at once with numpy, or in a single scan without.
+
+    Args:
+        bpass_ids (Sequence[int]): ids, e.g. of load_bpass_ids
+
+    Returns:
+        List[int]: missing ids, in increasing order
+    """
+    if not len(bpass_ids):
+        return []
+    if np is None:
+        lo, hi = min(bpass_ids), max(bpass_ids)
+        occupied = bytearray(hi - lo + 1)
+        for bpass_id in bpass_ids:
+            occupied[bpass_id - lo] = 1
+        return [lo + i for i in range(1, len(occupied) - 1)
+                if not occupied[i] and occupied[i-1] and occupied[i+1]]
+
+    bpass_ids = np.asarray(bpass_ids)
+    lo, hi = int(bpass_ids.min()), int(bpass_ids.max())
+    occupied = np.zeros(hi - lo + 1, dtype=bool)
+    occupied[bpass_ids - lo] = True
+    gaps = ~occupied[1:-1] & occupied[:-2] & occupied[2:]
+    return (lo + 1 + np.flatnonzero(gaps)).tolist()
 
 def find_max_bpass_id(bpasses: List[str]) -> int:
     """Given bpasses, returns max id
@@ -29,12 +146,7 @@ def find_max_bpass_id(bpasses: List[str]) -> int:
         bpasses (List[str]): contains bpasses of format e.g. BFFFBBFRRR
             of which max id must be found
     """
-    max_bpass_id = float('-inf')
-    for bpass in bpasses:
-        bpass_id = int(binarize_bpass(bpass), 2)
-        if bpass_id > max_bpass_id:
-            max_bpass_id = bpass_id
-    return max_bpass_id
+    return max(decode_bpasses(bpasses), default=float('-inf'))
 
 
 def find_my_bpass_id(bpasses: List[str]) -> int:
@@ -47,27 +159,30 @@ def find_my_bpass_id(bpasses: List[str]) -> int:
         bpasses (List[str]): contains bpasses of format e.g. BFFFBBFRRR
             of which missing id must be found
     """
-    found_ids = set()
-    min_bpass_id = float('inf')
-    max_bpass_id = float('-inf')
+    missing = bpass_ids_range(bpasses)[2]
+    if missing is None:
+        return 'my god, didnt find anything...'
+    return missing
+
+def part1(bpasses: List[str]) -> int:
+    """Highest boarding pass id"""
+    return find_max_bpass_id(bpasses)
 
-    for bpass in bpasses:
-        bpass_id = int(binarize_bpass(bpass), 2)
 
-        # update current lowest and highest ids, to know range of ids
-        if bpass_id > max_bpass_id:
-            max_bpass_id = bpass_id
-        if bpass_id < min_bpass_id:
-            min_bpass_id = bpass_id
+def part2(bpasses: List[str]) -> int:
+    """Id of the only missing boarding pass"""
+    return find_my_bpass_id(bpasses)
 
-        found_ids.add(bpass_id)
 
-    # look for first missing bpass_id in range
-    for bpass_id in range(min_bpass_id+1, max_bpass_id):
-        if bpass_id not in found_ids:
-            return bpass_id
+def solve(bpasses: List[str]) -> Tuple[int, int]:
+    """Answers to both parts, from a single decoding of bpasses"""
+    _, max_bpass_id, missing = bpass_ids_range(bpasses)
+    if max_bpass_id is None:
+        max_bpass_id = float('-inf')
+    if missing is None:
+        missing = 'my god, didnt find anything...'
+    return max_bpass_id, missing
 
-    return 'my god, didnt find anything...'
 
 if __name__ == "__main__":
     bpasses = parse_input_file()
@@ -1,9 +1,10 @@
-from typing import List, Set
+from typing import List, Set, Tuple
 
-def parse_input_file() -> List[List[str]]:
-    input_path = "./d6_custom_customs/input.txt"
-    with open(input_path, "r") as file:
-        groups_str = file.read().strip().split("\n\n")
+from aoc.inputs import Text, as_text, read_input
+from aoc.trace import DEBUG, trace
+
+def parse(text: Text) -> List[List[str]]:
+    groups_str = as_text(text).strip().split("\n\n")
 
     groups = []
     for group_str in groups_str:
@@ -12,6 +13,10 @@ def parse_input_file() -> List[List[str]]:
 
     return groups
 
+
+def parse_input_file() -> List[List[str]]:
+    return parse(read_input(__file__))
+
 def get_groups_ans_union_sum(groups: List[List[str]]) -> int:
     """Get the sum of lengths of the union of characters in each group
 
@@ -70,17 +75,32 @@ def get_groups_ans_intersection_sum(groups: List[List[str]]) -> int:
     """
     ret = 0
     for group in groups:
-        print(f'group: {group}')
+        trace(DEBUG, 'group: {}', group)
         ans_intersection = set([char for char in group[0]])
         for el in group[1:]:
             ans_intersection = ans_intersection.intersection(set([char for char in el]))
 
 
-        print(f'ans_intersection: {ans_intersection}')
+        trace(DEBUG, 'ans_intersection: {}', ans_intersection)
         ret += len(set(ans_intersection))
     return ret
 
 
+def part1(groups: List[List[str]]) -> int:
+    """Sum over groups of questions anyone answered "yes" to"""
+    return get_groups_ans_union_sum(groups)
+
+
+def part2(groups: List[List[str]]) -> int:
+    """Sum over groups of questions everyone answered "yes" to"""
+    return get_groups_ans_intersection_sum(groups)
+
+
+def solve(groups: List[List[str]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(groups), part2(groups)
+
+
 if __name__ == "__main__":
     groups = parse_input_file()
 
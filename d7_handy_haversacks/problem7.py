@@ -1,11 +1,12 @@
 import re
 from typing import List, Tuple, Dict, Set
 
+from aoc.inputs import Text, as_text, read_input
+
 Color = str
 
-def parse_input_file():
-    with open('./d7_handy_haversacks/input.txt', 'r') as f:
-        lines = f.read().strip().split('\n')
+def parse(text: Text) -> Dict[Color, Dict[Color, int]]:
+    lines = as_text(text).strip().split('\n')
 
     clr_contains = {}
     for line in lines:
@@ -25,11 +26,18 @@ def parse_input_file():
     return clr_contains
 
 
+def parse_input_file() -> Dict[Color, Dict[Color, int]]:
+    return parse(read_input(__file__))
+
+
 
 def get_containable_colors(color: Color, containers_dict: Dict[Color, Dict[Color, int]], l: List[Color]) -> List[Color]:
-    """Recursive DFS to get colors that can be contained by given starting color.
+    """DFS to get colors that can be contained by given starting color.
 
     Pruning could be implemented, therefore not efficient solution.
+    The DFS keeps an explicit stack of children iterators instead of recursing,
+    so depth is not bounded by the recursion limit. Colors are appended in
+    pre-order, as a recursive DFS would.
 
     Args:
         color (Color): color string, e.g. "shiny turquoise"
@@ -44,13 +52,19 @@ def get_containable_colors(color: Color, containers_dict: Dict[Color, Dict[Color
     if color not in containers_dict: # color considered does not have children -> useless
         return []
 
-    for clr in containers_dict[color].keys(): # consider each of the children colors
+    stack = [iter(containers_dict[color])] # children left to visit at each depth
+    while stack:
+        clr = next(stack[-1], None) # consider each of the children colors
+        if clr is None: # all children visited, back to the parent
+            stack.pop()
+            continue
         l.append(clr)
 
-        # recurse to populate l
-        get_containable_colors(clr, containers_dict, l)
+        # descend to populate l with the children of clr
+        if clr in containers_dict:
+            stack.append(iter(containers_dict[clr]))
 
-    # return recursively populated list of colors reachable from starting color
+    # return populated list of colors reachable from starting color
     return l
 
 
@@ -99,16 +113,45 @@ def get_n_bags_contained_in(containers_dict: Dict[Color, Dict[Color, int]], curr
         multiplier (int): number of bags of the current color containable within
             first layer bag color.
 
+    The DFS keeps an explicit stack of frames [color, multiplier, children
+    iterator, bags counted in children so far] instead of recursing.
+
     Returns:
         int: number of all bags that can be contained from top level
             bag color.
     """
-    if curr_clr not in containers_dict:
-        return 1 * multiplier # if no children, count bag itself
+    stack = [[curr_clr, multiplier, iter(containers_dict.get(curr_clr, {}).items()), 0]]
+    while True:
+        frame = stack[-1]
+        child = next(frame[2], None)
+        if child is not None: # descend into the next child
+            child_clr, mul = child
+            stack.append([child_clr, mul, iter(containers_dict.get(child_clr, {}).items()), 0])
+            continue
+
+        # all children counted (if no children, count bag itself)
+        _, multiplier, _, n_children_bags = stack.pop()
+        n_bags = (n_children_bags + 1) * multiplier
+        if not stack:
+            return n_bags
+        stack[-1][3] += n_bags
+
+
+
+def part1(containers_dict: Dict[Color, Dict[Color, int]]) -> int:
+    """Number of bag colors that can eventually contain a shiny gold bag"""
+    return count_target_color_containers(containers_dict, "shiny gold")
+
+
+def part2(containers_dict: Dict[Color, Dict[Color, int]]) -> int:
+    """Number of bags required inside a shiny gold bag"""
+    # minus 1 to not count the shiny bag
+    return get_n_bags_contained_in(containers_dict, "shiny gold", 1) - 1
 
-    # otherwise recurse
-    return (sum([get_bags_contained_in(containers_dict, child_clr, mul) for child_clr, mul in container_contains[curr_clr].items()])+1) * multiplier
 
+def solve(containers_dict: Dict[Color, Dict[Color, int]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(containers_dict), part2(containers_dict)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 from typing import List, Tuple
 
+from aoc.inputs import Text, as_text, read_input
 
-def parse_input_file():
-    input_path = "./d8_handheld_halting/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.read().strip().split("\n")
+
+def parse(text: Text) -> List[Tuple[str, int]]:
+    lines = as_text(text).strip().split("\n")
 
     instructions = []
     for line in lines:
@@ -14,6 +14,10 @@ def parse_input_file():
     return instructions
 
 
+def parse_input_file() -> List[Tuple[str, int]]:
+    return parse(read_input(__file__))
+
+
 def exec_instr(instrs: List[Tuple[str, int]], i: int, acc: int) -> Tuple[int, int]:
     """execute instruction at index i
 
@@ -92,41 +96,77 @@ def find_loop_instr_fix(instrs: List[Tuple[str, int]], i, acc, replaced: bool, i
         instrs (List[Tuple[str, int]]): instructions as tuples of
             command and argument.
 
+    The depth-first search over executions keeps an explicit stack of frames
+    [i, acc, replaced, stage] instead of recursing, stage being how far the
+    frame got: 0 not started, 1 tried without swapping, 2 tried swapping.
+    A program's length is therefore not bounded by the recursion limit.
+
     Returns:
         int: the acc value at loop occurrence
     """
-    # base case: correct termination
-    if i == len(instrs):
-        return True, acc # we had a run that terminates correctly
-    # base case2: incorrect termination, went over last line + 1
-    elif i > len(instrs):
-        return False, -1
-    # base case3: looped instruction, terminate
-    elif i in instrs_seen:
-        return False, -1
-
-    #### Execute instructions
-    instrs_seen.add(i)
-
-    ## WithOut Swapping (wos)
-    wos_i, wos_acc = exec_instr(instrs, i, acc)
-    not_swapping = find_loop_instr_fix(instrs, wos_i, wos_acc, replaced, instrs_seen)
-
-    if not_swapping[0]:
-        return not_swapping
-
-    # if instruction is jmp or nop, try the swap
-    if instrs[i][0] in ['jmp', 'nop'] and not replaced: # if we haven't replaced yet
-        # replace instruction
-        instrs[i] = ('jmp' if instrs[i][0]=='nop' else 'nop', instrs[i][1]) # modify only instr command, not param
-        ws_i, ws_acc = exec_instr(instrs, i, acc)
-        swapping = find_loop_instr_fix(instrs, ws_i, ws_acc, True, instrs_seen) # set replaced to true, can't replace twice
-        if swapping[0]:
-            return swapping
-        instrs[i] = ('jmp' if instrs[i][0]=='nop' else 'nop', instrs[i][1]) # revert change for future recursions
-
-    instrs_seen.remove(i)
-    return False, -1
+    stack = [[i, acc, replaced, 0]]
+    result = None # result of the last completed frame
+    while stack:
+        frame = stack[-1]
+        i, acc, replaced, stage = frame
+
+        if stage == 0:
+            # base case: correct termination
+            if i == len(instrs):
+                result = True, acc # we had a run that terminates correctly
+                stack.pop()
+            # base case2: incorrect termination, went over last line + 1
+            # base case3: looped instruction, terminate
+            elif i > len(instrs) or i in instrs_seen:
+                result = False, -1
+                stack.pop()
+            else:
+                #### Execute instructions
+                instrs_seen.add(i)
+
+                ## WithOut Swapping (wos)
+                wos_i, wos_acc = exec_instr(instrs, i, acc)
+                frame[3] = 1
+                stack.append([wos_i, wos_acc, replaced, 0])
+
+        elif stage == 1:
+            if result[0]: # not swapping terminated
+                stack.pop()
+            # if instruction is jmp or nop, try the swap
+            elif instrs[i][0] in ['jmp', 'nop'] and not replaced: # if we haven't replaced yet
+                # replace instruction
+                instrs[i] = ('jmp' if instrs[i][0]=='nop' else 'nop', instrs[i][1]) # modify only instr command, not param
+                ws_i, ws_acc = exec_instr(instrs, i, acc)
+                frame[3] = 2
+                stack.append([ws_i, ws_acc, True, 0]) # set replaced to true, can't replace twice
+            else:
+                instrs_seen.remove(i)
+                result = False, -1
+                stack.pop()
+
+        else:
+            if not result[0]: # swapping did not terminate either
+                instrs[i] = ('jmp' if instrs[i][0]=='nop' else 'nop', instrs[i][1]) # revert change for future runs
+                instrs_seen.remove(i)
+                result = False, -1
+            stack.pop()
+
+    return result
+
+
+def part1(instrs: List[Tuple[str, int]]) -> int:
+    """Accumulator value right before an instruction is executed twice"""
+    return find_instrs_loop(instrs)
+
+
+def part2(instrs: List[Tuple[str, int]]) -> int:
+    """Accumulator value once the program is fixed to terminate"""
+    return find_loop_instr_fix(instrs, 0, 0, False, set())[1]
+
+
+def solve(instrs: List[Tuple[str, int]]) -> Tuple[int, int]:
+    """Answers to both parts"""
+    return part1(instrs), part2(instrs)
 
 
 if __name__ == "__main__":
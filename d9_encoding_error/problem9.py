@@ -1,13 +1,16 @@
 from typing import List, Tuple
 import d1_report_repair.problem1 as problem1
+from aoc.inputs import Text, as_text, read_input
 
-def parse_input_file():
-    input_path = "./d9_encoding_error/input.txt"
-    with open(input_path, "r") as file:
-        lines = file.readlines()
+def parse(text: Text) -> List[int]:
+    lines = as_text(text).splitlines()
     return [int(line) for line in lines if line]
 
 
+def parse_input_file() -> List[int]:
+    return parse(read_input(__file__))
+
+
 def find_non_sum_of_prev(nums: List[int], prev: int = 25) -> int:
     """Find first number that is not a sum of any two prev numbers
 
@@ -28,9 +31,13 @@ def find_non_sum_of_prev(nums: List[int], prev: int = 25) -> int:
     Returns:
         int: number that is not sum of any two prev numbers.
     """
+    # index of the prev preceding numbers, slid along nums
+    window = problem1.SumIndex(nums[:prev])
     for idx in range(prev, len(nums)):
-        if problem1.find_two_ints_summing_to(nums[idx-prev: idx], nums[idx]) is None:
+        if window.pair_sum(nums[idx]) is None:
             return nums[idx]
+        window.remove(nums[idx-prev])
+        window.add(nums[idx])
 
 
 def find_contiguous_summing_to(nums: List[int], target: int) -> int:
@@ -66,6 +73,22 @@ def find_contiguous_summing_to(nums: List[int], target: int) -> int:
     min_val, max_val = min(nums[lo: hi+1]), max(nums[lo: hi+1])
     return min_val + max_val
 
+def part1(nums: List[int]) -> int:
+    """First number that is not the sum of two of the 25 before it"""
+    return find_non_sum_of_prev(nums)
+
+
+def part2(nums: List[int]) -> int:
+    """Encryption weakness of the contiguous range summing to part 1's answer"""
+    return find_contiguous_summing_to(nums, find_non_sum_of_prev(nums))
+
+
+def solve(nums: List[int]) -> Tuple[int, int]:
+    """Answers to both parts, reusing part 1's answer for part 2"""
+    ans1 = part1(nums)
+    return ans1, find_contiguous_summing_to(nums, ans1)
+
+
 if __name__ == "__main__":
     nums = parse_input_file()
 
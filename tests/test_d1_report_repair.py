@@ -0,0 +1,47 @@
+"""
+Parity of the bitmap searches of day 1 with their pure python fallback, and
+validity of the solutions they find.
+"""
+import math
+import random
+
+import pytest
+
+from d1_report_repair import problem1
+
+CASES = {
+    "real": (problem1.parse_input_file(), 2020),
+    "example": ([1721, 979, 366, 299, 675, 1456], 2020),
+    "half_total_once": ([1010, 5, 7], 2020),       # 1010 + 1010 needs two 1010s
+    "half_total_twice": ([1010, 5, 1010], 2020),
+    "none": ([1, 2, 4], 100),
+    "empty": ([], 2020),
+    "random": (random.Random(1).choices(range(3000), k=300), 2020),
+}
+
+
+def without_numpy(monkeypatch, func, *args):
+    with monkeypatch.context() as patch:
+        patch.setattr(problem1, "np", None)
+        return func(*args)
+
+
+def products(l, total, k):
+    """Products of all k ints of l summing to total, None if there are none"""
+    return {math.prod(ints) for ints in problem1.find_k_ints_summing_to(l, total, k, all_solutions=True)} or {None}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_fallback_finds_a_solution(name, monkeypatch):
+    l, total = CASES[name]
+    assert without_numpy(monkeypatch, problem1.find_two_ints_summing_to_bitmap, l, total) in products(l, total, 2)
+    assert without_numpy(monkeypatch, problem1.find_three_ints_summing_to_bitmap, l, total) in products(l, total, 3)
+    assert problem1.find_two_ints_summing_to(l, total) in products(l, total, 2)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_numpy_matches_fallback(name, monkeypatch):
+    pytest.importorskip("numpy")
+    l, total = CASES[name]
+    for func in (problem1.find_two_ints_summing_to_bitmap, problem1.find_three_ints_summing_to_bitmap):
+        assert func(l, total) == without_numpy(monkeypatch, func, l, total)
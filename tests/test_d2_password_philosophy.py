@@ -0,0 +1,40 @@
+"""
+Agreement of the columnar checks of day 2 passwords with the streaming count,
+with and without numpy.
+"""
+import pytest
+
+from aoc.generators import generate
+from d2_password_philosophy import problem2
+
+INPUTS = {
+    "real": problem2.read_input(problem2.__file__),
+    "generated": generate(2, 2000, seed=1),
+    "positions_out_of_password": "0-3 a: abc\n1-0 c: abc\n2-9 b: xb\n0-3 a: bca\n",
+}
+
+
+def counts(columns):
+    return sum(problem2.test_cases_pass_part1(columns)), sum(problem2.test_cases_pass_part2(columns))
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def numpy_or_fallback(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(problem2, "np", None)
+
+
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_columns_match_streaming(name, numpy_or_fallback):
+    text = INPUTS[name]
+    columns = problem2.PasswordColumns.from_text(text)
+    assert counts(columns) == problem2.count_valid_passwords_chunk(text.encode())
+
+
+def test_positions_out_of_password(numpy_or_fallback):
+    columns = problem2.PasswordColumns.from_text(INPUTS["positions_out_of_password"])
+    # position 0 and past the end never hold the char, e.g. not the last char
+    # of the previous password for the first line
+    assert list(problem2.test_cases_pass_part2(columns)) == [False, False, True, True]
@@ -0,0 +1,37 @@
+"""
+Parity of the memory-mapped landscape of day 3 with the parsed, in memory one.
+"""
+import pytest
+
+from aoc.generators import generate
+from d3_toboggan_trajectory import problem3
+
+INPUTS = {
+    "real": problem3.read_input(problem3.__file__),
+    "generated": generate(3, 500, seed=1),
+    "uneven_rows": "..#.\n#..\n.#..#\n", # offsets found line by line, no path to walk
+    "no_final_newline": "..#\n#..\n.#.",
+}
+SLOPES = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1), (3, 4)]
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def landscape_files(request, tmp_path):
+    paths = {}
+    for name, text in INPUTS.items():
+        paths[name] = tmp_path / f"{name}.txt"
+        paths[name].write_bytes(text.replace("\n", request.param).encode())
+    return paths
+
+
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_mapped_matches_parse(landscape_files, name):
+    landscape = problem3.parse(INPUTS[name])
+    with problem3.MappedLandscape.open(str(landscape_files[name])) as mapped:
+        assert len(mapped) == len(landscape)
+        assert [str(mapped[y]) for y in range(len(mapped))] == landscape
+        assert [len(mapped[y]) for y in range(len(mapped))] == [len(row) for row in landscape]
+        if len(set(map(len, landscape))) > 1:
+            return
+        for slope in SLOPES:
+            assert problem3.count_trees_in_path(mapped, slope) == problem3.count_trees_in_path(landscape, slope)
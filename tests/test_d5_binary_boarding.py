@@ -0,0 +1,63 @@
+"""
+Parity of the numpy loader of day 5 boarding passes with its pure python fallback.
+"""
+import pytest
+
+from aoc.generators import generate
+from d5_binary_boarding import problem5
+
+INPUTS = {
+    "real": problem5.read_input(problem5.__file__),
+    "generated": generate(5, 2000, seed=1), # 12 bits ids, wider than the real 10
+    "no_final_newline": "FBFBBFFRLR\nBFFFBBFRRR",
+    "empty": "",
+}
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def bpass_files(request, tmp_path):
+    paths = {}
+    for name, text in INPUTS.items():
+        paths[name] = tmp_path / f"{name}.txt"
+        paths[name].write_bytes(text.replace("\n", request.param).encode())
+    return paths
+
+
+def load_without_numpy(path, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(problem5, "np", None)
+        return list(problem5.load_bpass_ids(str(path)))
+
+
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_fallback_matches_parse(bpass_files, name, monkeypatch):
+    expected = problem5.decode_bpasses(problem5.parse(INPUTS[name])) if INPUTS[name] else []
+    assert load_without_numpy(bpass_files[name], monkeypatch) == expected
+
+
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_numpy_matches_fallback(bpass_files, name, monkeypatch):
+    pytest.importorskip("numpy")
+    ids = problem5.load_bpass_ids(str(bpass_files[name]))
+    assert ids.tolist() == load_without_numpy(bpass_files[name], monkeypatch)
+    assert problem5.find_missing_bpass_ids(ids) == problem5.find_missing_bpass_ids(ids.tolist())
+
+
+def test_invalid_chars_rejected(tmp_path, monkeypatch):
+    path = tmp_path / "invalid.txt"
+    path.write_text("FBFBBFFRLR\nBFFXBBFRRR\n")
+    with pytest.raises(ValueError):
+        problem5.load_bpass_ids(str(path))
+    with pytest.raises(ValueError):
+        load_without_numpy(path, monkeypatch)
+
+
+@pytest.mark.parametrize("ids, expected", [
+    ([0, 1, 3, 5, 6, 7, 8, 9], (0, 9, 2)),      # several gaps: the first one
+    ([4, 4, 6], (4, 6, 5)),                      # duplicates
+    ([8, 9, 10], (8, 10, None)),
+    ([], (None, None, None)),
+])
+def test_bpass_ids_range(ids, expected):
+    bpasses = [format(i, "010b").translate(str.maketrans("01", "FB")) for i in ids]
+    assert problem5.bpass_ids_range(bpasses) == expected